@@ -20,18 +20,40 @@ class Config:
     }
     
     # Timeouts (in seconds)
-    IMPLICIT_WAIT = 10
+    IMPLICIT_WAIT = 0  # Explicit waits only
     EXPLICIT_WAIT = 20
-    PAGE_LOAD_TIMEOUT = 30
+    SHORT_WAIT = 10
+    PAGE_LOAD_TIMEOUT = 15
     SCRIPT_TIMEOUT = 30
+    CMD_TIMEOUT = 20  # HTTP timeout per WebDriver command, must exceed PAGE_LOAD_TIMEOUT
+    
+    # Wait polling (in seconds)
+    POLL_FREQUENCY = 0.5
+    FAST_POLL_FREQUENCY = 0.05
     
     # Browser configuration
     BROWSERS = ["chrome", "firefox"]
     DEFAULT_BROWSER = "chrome"
     HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
     
+    # Selenium Grid hub (e.g. http://localhost:4444/wd/hub), local browser when unset
+    SELENIUM_HUB_URL = os.getenv("SELENIUM_HUB_URL")
+    
+    # Page load strategy ('normal' waits for all subresources, 'eager' for DOMContentLoaded)
+    PAGE_LOAD_STRATEGY = "eager"
+    
     # Window configuration
-    WINDOW_SIZE = (1920, 1080)
+    WINDOW_SIZE = (1280, 720)
+    
+    # Chrome disk cache size (in bytes)
+    DISK_CACHE_SIZE = 100 * 1024 * 1024
+    
+    # Resources blocked in Chrome (not needed by any assertion)
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+        "*.woff", "*.woff2", "*.ttf", "*.mp4",
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook*"
+    ]
     
     # Test data for checkout
     TEST_DATA = {
@@ -114,7 +136,8 @@ class Config:
             "implicit_wait": cls.IMPLICIT_WAIT,
             "explicit_wait": cls.EXPLICIT_WAIT,
             "page_load_timeout": cls.PAGE_LOAD_TIMEOUT,
-            "script_timeout": cls.SCRIPT_TIMEOUT
+            "script_timeout": cls.SCRIPT_TIMEOUT,
+            "command_timeout": cls.CMD_TIMEOUT
         }
     
     @classmethod
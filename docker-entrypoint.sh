@@ -24,6 +24,7 @@ show_help() {
     echo "  BROWSER       - Browser to use (chrome/firefox)"
     echo "  HEADLESS      - Headless mode (true/false)"
     echo "  TEST_SUITE    - Test suite (all/login/products/cart/checkout)"
+    echo "  SELENIUM_HUB_URL - Selenium Grid hub URL (optional)"
 }
 
 # Function to setup virtual display (Xvfb)
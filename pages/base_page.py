@@ -72,20 +72,21 @@ class BasePage:
             self.logger.error(f"Elements not found: {locator}")
             return []
     
-    def wait_for_element_visible(self, locator: tuple, timeout: int = None) -> WebElement:
+    def wait_for_element_visible(self, locator: tuple, timeout: int = None, poll_frequency: float = None) -> WebElement:
         """
         Wait for element to be visible
         
         Args:
             locator (tuple): Tuple (By, selector)
             timeout (int): Custom wait time
+            poll_frequency (float): Custom polling interval
         
         Returns:
             WebElement: Visible element
         """
         try:
             wait_time = timeout or Config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = WebDriverWait(self.driver, wait_time, poll_frequency=poll_frequency or Config.POLL_FREQUENCY)
             element = wait.until(EC.visibility_of_element_located(locator))
             self.logger.debug(f"Element visible: {locator}")
             return element
@@ -93,20 +94,42 @@ class BasePage:
             self.logger.error(f"Element not visible: {locator}")
             raise
     
-    def wait_for_element_clickable(self, locator: tuple, timeout: int = None) -> WebElement:
+    def wait_for_all_elements_visible(self, locator: tuple, timeout: int = None) -> List[WebElement]:
+        """
+        Wait for all elements matching locator to be visible
+        
+        Args:
+            locator (tuple): Tuple (By, selector)
+            timeout (int): Custom wait time
+        
+        Returns:
+            List[WebElement]: Visible elements
+        """
+        try:
+            wait_time = timeout or Config.EXPLICIT_WAIT
+            wait = WebDriverWait(self.driver, wait_time)
+            elements = wait.until(EC.visibility_of_all_elements_located(locator))
+            self.logger.debug(f"Elements visible: {len(elements)} {locator}")
+            return elements
+        except TimeoutException:
+            self.logger.error(f"Elements not visible: {locator}")
+            return []
+    
+    def wait_for_element_clickable(self, locator: tuple, timeout: int = None, poll_frequency: float = None) -> WebElement:
         """
         Wait for element to be clickable
         
         Args:
             locator (tuple): Tuple (By, selector)
             timeout (int): Custom wait time
+            poll_frequency (float): Custom polling interval
         
         Returns:
             WebElement: Clickable element
         """
         try:
             wait_time = timeout or Config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = WebDriverWait(self.driver, wait_time, poll_frequency=poll_frequency or Config.POLL_FREQUENCY)
             element = wait.until(EC.element_to_be_clickable(locator))
             self.logger.debug(f"Element clickable: {locator}")
             return element
@@ -114,20 +137,21 @@ class BasePage:
             self.logger.error(f"Element not clickable: {locator}")
             raise
     
-    def click_element(self, locator: tuple, timeout: int = None) -> bool:
+    def click_element(self, locator: tuple, timeout: int = None, poll_frequency: float = None) -> bool:
         """
         Click element with retry mechanism
         
         Args:
             locator (tuple): Tuple (By, selector)
             timeout (int): Custom wait time
+            poll_frequency (float): Custom polling interval
         
         Returns:
             bool: True if successful
         """
         for attempt in range(Config.MAX_RETRIES):
             try:
-                element = self.wait_for_element_clickable(locator, timeout)
+                element = self.wait_for_element_clickable(locator, timeout, poll_frequency)
                 element.click()
                 self.logger.info(f"Click successful: {locator}")
                 return True
@@ -209,6 +233,9 @@ class BasePage:
         """
         Check if element is present
         
+        Without a timeout the DOM is checked once, so an absent element
+        returns False immediately instead of blocking.
+        
         Args:
             locator (tuple): Tuple (By, selector)
             timeout (int): Custom wait time
@@ -216,9 +243,15 @@ class BasePage:
         Returns:
             bool: True if present
         """
+        if timeout is None:
+            try:
+                self.driver.find_element(*locator)
+                return True
+            except NoSuchElementException:
+                return False
+        
         try:
-            wait_time = timeout or 2
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = WebDriverWait(self.driver, timeout)
             wait.until(EC.presence_of_element_located(locator))
             return True
         except TimeoutException:
@@ -228,6 +261,8 @@ class BasePage:
         """
         Check if element is visible
         
+        Returns False for absent elements as well, so it also covers presence.
+        
         Args:
             locator (tuple): Tuple (By, selector)
             timeout (int): Custom wait time
@@ -450,6 +485,9 @@ class BasePage:
         """
         Wait for page to load completely
         
+        With the eager page load strategy the DOM being ready ("interactive") is enough;
+        content loaded afterwards is covered by explicit element waits.
+        
         Args:
             timeout (int): Custom wait time
         
@@ -459,7 +497,7 @@ class BasePage:
         try:
             wait_time = timeout or Config.PAGE_LOAD_TIMEOUT
             wait = WebDriverWait(self.driver, wait_time)
-            wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            wait.until(lambda driver: driver.execute_script("return document.readyState") in ("interactive", "complete"))
             self.logger.debug("Page loaded completely")
             return True
         except TimeoutException:
@@ -470,11 +508,21 @@ class BasePage:
         """
         Refresh current page
         
+        Chrome reloads through DevTools (Page.reload), other drivers use refresh().
+        
         Returns:
             bool: True if successful
         """
         try:
-            self.driver.refresh()
+            if hasattr(self.driver, "execute_cdp_cmd"):
+                # Wait only until the old document is replaced, then for the new one to load
+                old_root = self.driver.find_element(By.TAG_NAME, "html")
+                self.driver.execute_cdp_cmd("Page.reload", {"ignoreCache": False})
+                WebDriverWait(self.driver, Config.PAGE_LOAD_TIMEOUT, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+                    EC.staleness_of(old_root)
+                )
+            else:
+                self.driver.refresh()
             self.wait_for_page_load()
             self.logger.info("Page refreshed")
             return True
@@ -482,6 +530,48 @@ class BasePage:
             self.logger.error(f"Error refreshing page: {e}")
             return False
     
+    def goto(self, url: str) -> bool:
+        """
+        Navigate to URL only if the browser is not already there
+        
+        Args:
+            url (str): Destination URL
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            if self.driver.current_url.rstrip('/') != url.rstrip('/'):
+                self.driver.get(url)
+                self.logger.debug(f"Navigated to: {url}")
+            else:
+                self.logger.debug(f"Already on {url}, skipping navigation")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error navigating to {url}: {e}")
+            return False
+    
+    def wait_for_url_contains(self, fragment: str, timeout: int = None) -> bool:
+        """
+        Wait for the browser URL to contain a fragment
+        
+        Args:
+            fragment (str): Expected part of the URL
+            timeout (int): Custom wait time
+        
+        Returns:
+            bool: True if the URL contains the fragment in time
+        """
+        try:
+            wait_time = timeout or Config.SHORT_WAIT
+            WebDriverWait(self.driver, wait_time, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+                EC.url_contains(fragment)
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning(f"URL does not contain '{fragment}': {self.driver.current_url}")
+            return False
+    
     def get_current_url(self) -> str:
         """
         Get current URL
@@ -5,9 +5,11 @@ Handles cart display and product management
 
 import logging
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
 from config.config import Config
+from utils.cart_cache import invalidate_cart_cache, wait_for_cart_rendered
 
 
 class CartPage(BasePage):
@@ -16,7 +18,7 @@ class CartPage(BasePage):
     # Main locators
     CART_TITLE = (By.XPATH, "//h2[text()='Products']")
     CART_TABLE = (By.XPATH, "//table[@class='table table-bordered table-hover table-striped']")
-    CART_ROWS = (By.XPATH, "//tbody/tr")
+    CART_ROWS = (By.CSS_SELECTOR, "#tbodyid > tr")
     
     # Product information in cart
     PRODUCT_TITLES = (By.XPATH, "//tbody/tr/td[2]")
@@ -27,15 +29,28 @@ class CartPage(BasePage):
     PLACE_ORDER_BUTTON = (By.XPATH, "//button[text()='Place Order']")
     DELETE_ALL_BUTTON = (By.XPATH, "//button[text()='Delete']")
     
+    # Cart title and place order button in a single query
+    MAIN_ELEMENTS = (By.XPATH, "//h2[text()='Products'] | //button[text()='Place Order']")
+    
     # Cart total
     TOTAL_PRICE = (By.XPATH, "//h3[@id='totalp']")
     
     # Navigation
-    HOME_LINK = (By.XPATH, "//a[text()='Home ']")
+    HOME_LINK = (By.CSS_SELECTOR, "#navbarExample a.nav-link[href='index.html']")
     
     # Messages
     EMPTY_CART_MESSAGE = (By.XPATH, "//h2[text()='Products']/following-sibling::p")
     
+    # Collects title, price and delete link of every cart row in one round-trip
+    CART_PRODUCTS_SCRIPT = """
+        return Array.from(document.querySelectorAll('#tbodyid > tr')).map((row, i) => ({
+            index: i,
+            title: row.cells[1] ? row.cells[1].innerText.trim() : '',
+            price: row.cells[2] ? row.cells[2].innerText.trim() : '',
+            delete_button: row.cells[3] ? row.cells[3].querySelector('a') : null
+        }));
+    """
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.logger = logging.getLogger(__name__)
@@ -61,26 +76,9 @@ class CartPage(BasePage):
             list: List of product dictionaries
         """
         try:
-            products = []
-            cart_rows = self.find_elements(self.CART_ROWS)
-            
-            for i, row in enumerate(cart_rows):
-                try:
-                    # Get product information from each row
-                    title_element = row.find_element(By.XPATH, ".//td[2]")
-                    price_element = row.find_element(By.XPATH, ".//td[3]")
-                    delete_button = row.find_element(By.XPATH, ".//td[4]/a")
-                    
-                    product_info = {
-                        'index': i,
-                        'title': title_element.text,
-                        'price': price_element.text,
-                        'delete_button': delete_button
-                    }
-                    products.append(product_info)
-                except Exception as e:
-                    self.logger.warning(f"Error extracting product info from row {i}: {e}")
-                    continue
+            # Wait for the cart requests to finish, then read all rows (possibly none) in a single script
+            wait_for_cart_rendered(self.driver)
+            products = self.driver.execute_script(self.CART_PRODUCTS_SCRIPT)
             
             self.logger.info(f"Found {len(products)} products in cart")
             return products
@@ -88,6 +86,36 @@ class CartPage(BasePage):
             self.logger.error(f"Error getting cart products: {e}")
             return []
     
+    def seed_cart(self, product_ids: list) -> bool:
+        """
+        Add products to cart by calling the site's addToCart function directly
+        
+        Args:
+            product_ids (list): Product ids to add
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            # addToCart is defined on the product page, open it once for all products
+            self.driver.get(f"{Config.BASE_URL}/prod.html?idp_={product_ids[0]}")
+            wait = WebDriverWait(self.driver, Config.EXPLICIT_WAIT)
+            wait.until(lambda driver: driver.execute_script("return typeof addToCart === 'function'"))
+            
+            for product_id in product_ids:
+                self.driver.execute_script("addToCart(arguments[0]);", product_id)
+                invalidate_cart_cache(self.driver)
+                if self.wait_for_alert(timeout=5):
+                    self.accept_alert()
+                else:
+                    self.logger.warning(f"No alert appeared after adding product {product_id}")
+            
+            self.logger.info(f"Seeded cart with products: {product_ids}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error seeding cart: {e}")
+            return False
+    
     def get_cart_total(self) -> str:
         """
         Get cart total price
@@ -118,15 +146,14 @@ class CartPage(BasePage):
             if product_index < len(products):
                 delete_button = products[product_index]['delete_button']
                 delete_button.click()
+                invalidate_cart_cache(self.driver)
                 
                 # Wait for page to update
                 import time
                 time.sleep(2)
                 self.wait_for_page_load()
                 
-                # Verify product was deleted by checking count
-                new_count = self.get_cart_count()
-                self.logger.info(f"Deleted product at index {product_index}, new count: {new_count}")
+                self.logger.info(f"Deleted product at index {product_index}")
                 return True
             else:
                 self.logger.error(f"Product index {product_index} out of range")
@@ -228,7 +255,8 @@ class CartPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.click_element(self.HOME_LINK):
+            # The home link points to index.html, wait for that document before reporting success
+            if self.click_element(self.HOME_LINK, poll_frequency=Config.FAST_POLL_FREQUENCY) and self.wait_for_url_contains("index.html"):
                 self.wait_for_page_load()
                 self.logger.info("Navigated to home page")
                 return True
@@ -5,7 +5,9 @@ Handles the purchase completion process
 
 import logging
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoAlertPresentException
 from pages.base_page import BasePage
 from config.config import Config
 
@@ -15,7 +17,7 @@ class CheckoutPage(BasePage):
     
     # Checkout modal
     CHECKOUT_MODAL = (By.ID, "orderModal")
-    MODAL_TITLE = (By.XPATH, "//h5[@id='orderModalLabel']")
+    MODAL_TITLE = (By.CSS_SELECTOR, "#orderModalLabel")
     
     # Information form
     NAME_INPUT = (By.ID, "name")
@@ -26,14 +28,101 @@ class CheckoutPage(BasePage):
     YEAR_INPUT = (By.ID, "year")
     
     # Buttons
+    PLACE_ORDER_BUTTON = (By.XPATH, "//button[text()='Place Order']")
     PURCHASE_BUTTON = (By.XPATH, "//button[text()='Purchase']")
     CLOSE_BUTTON = (By.XPATH, "//button[text()='Close']")
     
     # Confirmation modal (Sweet Alert)
     CONFIRMATION_MODAL = (By.CLASS_NAME, "sweet-alert")
-    CONFIRMATION_TITLE = (By.XPATH, "//div[@class='sweet-alert showSweetAlert visible']//h2")
-    CONFIRMATION_MESSAGE = (By.XPATH, "//div[@class='sweet-alert showSweetAlert visible']//p[@class='lead text-muted']")
-    CONFIRMATION_BUTTON = (By.XPATH, "//div[@class='sweet-alert showSweetAlert visible']//div[@class='sa-confirm-button-container']//button")
+    CONFIRMATION_TITLE = (By.CSS_SELECTOR, ".sweet-alert.showSweetAlert.visible h2")
+    CONFIRMATION_MESSAGE = (By.CSS_SELECTOR, ".sweet-alert.showSweetAlert.visible p.lead.text-muted")
+    CONFIRMATION_BUTTON = (By.CSS_SELECTOR, ".sweet-alert.showSweetAlert.visible .sa-confirm-button-container button")
+    
+    # CSS selectors for batched checks in the browser
+    MODAL_TITLE_SELECTOR = "#orderModalLabel"
+    FORM_INPUT_SELECTORS = [
+        "#orderModal #name",
+        "#orderModal #country",
+        "#orderModal #city",
+        "#orderModal #card",
+        "#orderModal #month",
+        "#orderModal #year"
+    ]
+    PURCHASE_BUTTON_SELECTOR = "#orderModal .modal-footer .btn-primary"
+    CLOSE_BUTTON_SELECTOR = "#orderModal .modal-footer .btn-secondary"
+    X_BUTTON_SELECTOR = "#orderModal .modal-header .close"
+    X_CLOSE_BUTTON = (By.CSS_SELECTOR, "div#orderModal button.close")
+    
+    # Returns one boolean per selector; arguments[1] also requires the element to be rendered
+    ELEMENTS_PRESENT_SCRIPT = """
+        var checkVisible = arguments[1];
+        return arguments[0].map(function(selector) {
+            var el = document.querySelector(selector);
+            return !!el && (!checkVisible || el.getClientRects().length > 0);
+        });
+    """
+    
+    # Form data keys mapped to input ids
+    FORM_FIELD_IDS = {
+        'name': 'name',
+        'country': 'country',
+        'city': 'city',
+        'credit_card': 'card',
+        'month': 'month',
+        'year': 'year'
+    }
+    
+    # Sets every input in one call and returns the ids that were not found or not interactable
+    # (hidden, e.g. modal closed, or disabled), so a broken modal fails like a real user would
+    FILL_FORM_SCRIPT = """
+        function interactable(el) {
+            return !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden'
+                && !el.disabled && !el.readOnly;
+        }
+        var values = arguments[0];
+        var missing = [];
+        Object.keys(values).forEach(function(id) {
+            var el = document.getElementById(id);
+            if (!interactable(el)) {
+                missing.push(id);
+                return;
+            }
+            el.value = values[id];
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        });
+        return missing;
+    """
+    
+    # Sets one input and returns its value as read back by the browser, null if not found or not interactable
+    SET_FIELD_SCRIPT = """
+        var el = document.getElementById(arguments[0]);
+        if (!el || el.getClientRects().length === 0 || getComputedStyle(el).visibility === 'hidden'
+                || el.disabled || el.readOnly) {
+            return null;
+        }
+        el.value = arguments[1];
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return el.value;
+    """
+    
+    # Parses the confirmation text ("Id: ...", "Amount: ...") into a dict keyed like ORDER_* fields
+    ORDER_DETAILS_SCRIPT = """
+        var p = document.querySelector('.sweet-alert p.text-muted') || document.querySelector('.sweet-alert p');
+        var text = p ? p.innerText.trim() : '';
+        var prefixes = {'Id:': 'id', 'Amount:': 'amount', 'Card Number:': 'card', 'Name:': 'name', 'Date:': 'date'};
+        var details = {};
+        text.split('\\n').forEach(function(line) {
+            line = line.trim();
+            Object.keys(prefixes).forEach(function(prefix) {
+                if (line.indexOf(prefix) === 0) {
+                    details[prefixes[prefix]] = line;
+                }
+            });
+        });
+        return details;
+    """
     
     # Order information
     ORDER_ID = (By.XPATH, "//p[contains(text(), 'Id:')]")
@@ -50,15 +139,21 @@ class CheckoutPage(BasePage):
         """
         Proceed to checkout from cart page
         
+        Navigates to the cart first unless the browser is already there.
+        
         Returns:
             bool: True if successful
         """
         try:
-            # Look for Place Order button
-            place_order_button = (By.XPATH, "//button[text()='Place Order']")
-            if self.wait_for_element_clickable(place_order_button, timeout=10):
-                self.click_element(place_order_button)
+            if not self.goto(f"{Config.BASE_URL}/cart.html"):
+                return False
+            
+            # Click Place Order as soon as it is clickable
+            if self.click_element(self.PLACE_ORDER_BUTTON, timeout=10, poll_frequency=Config.FAST_POLL_FREQUENCY):
                 self.logger.info("Clicked Place Order button")
+                
+                # Wait for the modal form to be rendered
+                self.wait_for_element_visible(self.NAME_INPUT, timeout=5, poll_frequency=Config.FAST_POLL_FREQUENCY)
                 return True
             else:
                 self.logger.error("Place Order button not found or not clickable")
@@ -67,6 +162,35 @@ class CheckoutPage(BasePage):
             self.logger.error(f"Error proceeding to checkout: {e}")
             return False
     
+    def batch_elements_present(self, selectors: list, visible: bool = False, timeout: int = None) -> list:
+        """
+        Check several CSS selectors with a single script call in the browser
+        
+        Args:
+            selectors (list): CSS selectors to check
+            visible (bool): Also require each element to be rendered
+            timeout (int): Time to wait for all selectors to match
+        
+        Returns:
+            list: One boolean per selector, in the same order
+        """
+        wait_time = timeout or Config.SHORT_WAIT
+        results = [False] * len(selectors)
+        
+        def all_found(driver):
+            nonlocal results
+            results = driver.execute_script(self.ELEMENTS_PRESENT_SCRIPT, selectors, visible)
+            return all(results)
+        
+        try:
+            WebDriverWait(self.driver, wait_time, poll_frequency=Config.FAST_POLL_FREQUENCY).until(all_found)
+        except TimeoutException:
+            missing = [selector for selector, found in zip(selectors, results) if not found]
+            self.logger.warning(f"Elements not found after {wait_time}s: {missing}")
+        except Exception as e:
+            self.logger.error(f"Error checking elements {selectors}: {e}")
+        return results
+    
     def is_checkout_modal_visible(self) -> bool:
         """
         Check if checkout modal is visible
@@ -91,6 +215,23 @@ class CheckoutPage(BasePage):
             self.logger.error(f"Error checking checkout modal visibility: {e}")
             return False
     
+    def _set_field_value(self, field_id: str, value: str) -> bool:
+        """
+        Set a form field with a single script call and verify the value stuck
+        
+        Args:
+            field_id (str): Input element id
+            value (str): Value to set
+        
+        Returns:
+            bool: True if the field holds the value
+        """
+        actual = self.driver.execute_script(self.SET_FIELD_SCRIPT, field_id, value)
+        if actual != value:
+            self.logger.error(f"Field {field_id} holds {actual!r}, expected {value!r}")
+            return False
+        return True
+    
     def fill_name(self, name: str) -> bool:
         """
         Fill name field
@@ -102,7 +243,7 @@ class CheckoutPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.send_keys(self.NAME_INPUT, name):
+            if self._set_field_value(self.FORM_FIELD_IDS['name'], name):
                 self.logger.info(f"Name filled: {name}")
                 return True
             return False
@@ -121,7 +262,7 @@ class CheckoutPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.send_keys(self.COUNTRY_INPUT, country):
+            if self._set_field_value(self.FORM_FIELD_IDS['country'], country):
                 self.logger.info(f"Country filled: {country}")
                 return True
             return False
@@ -140,7 +281,7 @@ class CheckoutPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.send_keys(self.CITY_INPUT, city):
+            if self._set_field_value(self.FORM_FIELD_IDS['city'], city):
                 self.logger.info(f"City filled: {city}")
                 return True
             return False
@@ -159,7 +300,7 @@ class CheckoutPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.send_keys(self.CREDIT_CARD_INPUT, card_number):
+            if self._set_field_value(self.FORM_FIELD_IDS['credit_card'], card_number):
                 self.logger.info("Credit card filled")
                 return True
             return False
@@ -178,7 +319,7 @@ class CheckoutPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.send_keys(self.MONTH_INPUT, month):
+            if self._set_field_value(self.FORM_FIELD_IDS['month'], month):
                 self.logger.info(f"Month filled: {month}")
                 return True
             return False
@@ -197,7 +338,7 @@ class CheckoutPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.send_keys(self.YEAR_INPUT, year):
+            if self._set_field_value(self.FORM_FIELD_IDS['year'], year):
                 self.logger.info(f"Year filled: {year}")
                 return True
             return False
@@ -220,20 +361,15 @@ class CheckoutPage(BasePage):
             if not form_data:
                 form_data = Config.TEST_DATA["shipping"]
             
-            # Fill all form fields
-            fields = [
-                (self.NAME_INPUT, form_data.get('name', '')),
-                (self.COUNTRY_INPUT, form_data.get('country', '')),
-                (self.CITY_INPUT, form_data.get('city', '')),
-                (self.CREDIT_CARD_INPUT, form_data.get('credit_card', '')),
-                (self.MONTH_INPUT, form_data.get('month', '')),
-                (self.YEAR_INPUT, form_data.get('year', ''))
-            ]
-            
-            for locator, value in fields:
-                if not self.send_keys(locator, value):
-                    self.logger.error(f"Failed to fill field: {locator}")
-                    return False
+            # Fill all form fields in a single browser call
+            values = {
+                field_id: form_data.get(key, '')
+                for key, field_id in self.FORM_FIELD_IDS.items()
+            }
+            missing = self.driver.execute_script(self.FILL_FORM_SCRIPT, values)
+            if missing:
+                self.logger.error(f"Fields missing or not interactable: {missing}")
+                return False
             
             self.logger.info("Checkout form filled successfully")
             return True
@@ -252,19 +388,25 @@ class CheckoutPage(BasePage):
             if self.click_element(self.PURCHASE_BUTTON):
                 self.logger.info("Purchase button clicked")
                 
-                # Handle any alert that might appear
+                # Wait for whichever comes first: validation alert or Sweet Alert confirmation
                 try:
-                    if self.wait_for_alert(timeout=2):
-                        alert = self.driver.switch_to.alert
-                        alert_text = alert.text
-                        self.logger.info(f"Alert appeared after purchase click: {alert_text}")
-                        alert.accept()
-                except Exception as alert_error:
-                    self.logger.debug(f"No alert or error handling alert: {alert_error}")
+                    WebDriverWait(self.driver, 5, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+                        EC.any_of(
+                            EC.alert_is_present(),
+                            EC.visibility_of_element_located(self.CONFIRMATION_MODAL)
+                        )
+                    )
+                except TimeoutException:
+                    self.logger.debug("No alert or confirmation after purchase click")
                 
-                # Wait a bit for Sweet Alert to appear
-                import time
-                time.sleep(2)
+                # Handle any alert that might appear
+                try:
+                    alert = self.driver.switch_to.alert
+                    alert_text = alert.text
+                    self.logger.info(f"Alert appeared after purchase click: {alert_text}")
+                    alert.accept()
+                except NoAlertPresentException:
+                    pass
                 
                 return True
             return False
@@ -295,12 +437,8 @@ class CheckoutPage(BasePage):
                 close_button = self.find_element(self.CLOSE_BUTTON)
                 self.driver.execute_script("arguments[0].click();", close_button)
                 
-                # Wait a bit for the modal to close
-                import time
-                time.sleep(1)
-                
                 # Verify modal is actually closed
-                if not self.is_checkout_modal_visible():
+                if self._wait_for_modal_closed():
                     self.logger.info("Checkout modal closed with JavaScript")
                     return True
                 else:
@@ -310,8 +448,7 @@ class CheckoutPage(BasePage):
             
             # Strategy 3: Try clicking the X button (if different from Close button)
             try:
-                x_button = (By.XPATH, "//div[@id='orderModal']//button[@class='close']")
-                if self.click_element(x_button):
+                if self.click_element(self.X_CLOSE_BUTTON):
                     self.logger.info("Checkout modal closed with X button")
                     return True
             except Exception as e:
@@ -322,12 +459,8 @@ class CheckoutPage(BasePage):
                 from selenium.webdriver.common.keys import Keys
                 self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
                 
-                # Wait a bit for the modal to close
-                import time
-                time.sleep(1)
-                
                 # Verify modal is actually closed
-                if not self.is_checkout_modal_visible():
+                if self._wait_for_modal_closed():
                     self.logger.info("Checkout modal closed with Escape key")
                     return True
                 else:
@@ -340,6 +473,24 @@ class CheckoutPage(BasePage):
             self.logger.error(f"Error closing checkout modal: {e}")
             return False
     
+    def _wait_for_modal_closed(self, timeout: int = 2) -> bool:
+        """
+        Wait for the checkout modal to be hidden
+        
+        Args:
+            timeout (int): Wait timeout
+        
+        Returns:
+            bool: True if modal is hidden
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+                EC.invisibility_of_element_located(self.CHECKOUT_MODAL)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def complete_purchase(self, form_data: dict = None) -> bool:
         """
         Complete entire purchase process
@@ -380,36 +531,23 @@ class CheckoutPage(BasePage):
             bool: True if modal appears
         """
         try:
-            # Try multiple selectors for the Sweet Alert
-            selectors = [
-                (By.XPATH, "//div[@class='sweet-alert showSweetAlert visible']"),
-                (By.XPATH, "//div[contains(@class, 'sweet-alert') and contains(@class, 'showSweetAlert')]"),
-                (By.XPATH, "//div[contains(@class, 'sweet-alert') and contains(@class, 'visible')]"),
-                (By.CLASS_NAME, "sweet-alert"),
-                (By.XPATH, "//div[@class='sweet-alert']"),
-                (By.XPATH, "//h2[contains(text(), 'Thank you')]"),
-                (By.XPATH, "//h2[contains(text(), 'purchase')]")
-            ]
-            
-            for selector in selectors:
-                try:
-                    if self.wait_for_element_visible(selector, timeout=3):
-                        self.logger.info(f"Confirmation modal appeared with selector: {selector}")
-                        return True
-                except:
-                    continue
+            # Return as soon as the Sweet Alert is shown, or an alert appears instead
+            WebDriverWait(self.driver, timeout, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+                EC.any_of(
+                    EC.visibility_of_element_located(self.CONFIRMATION_MODAL),
+                    EC.alert_is_present()
+                )
+            )
             
-            # If no specific modal found, check if there's any alert or confirmation
             try:
-                if self.wait_for_alert(timeout=2):
-                    alert = self.driver.switch_to.alert
-                    alert_text = alert.text
-                    self.logger.info(f"Alert appeared instead of modal: {alert_text}")
-                    alert.accept()
-                    return True
-            except:
-                pass
-            
+                alert = self.driver.switch_to.alert
+                alert_text = alert.text
+                self.logger.info(f"Alert appeared instead of modal: {alert_text}")
+                alert.accept()
+            except NoAlertPresentException:
+                self.logger.info("Confirmation modal appeared")
+            return True
+        except TimeoutException:
             self.logger.warning("No confirmation modal found")
             return False
         except Exception as e:
@@ -516,8 +654,8 @@ class CheckoutPage(BasePage):
         try:
             # Try multiple selectors for the OK button
             selectors = [
-                (By.XPATH, "//div[contains(@class, 'sweet-alert')]//div[@class='sa-confirm-button-container']//button"),
-                (By.XPATH, "//div[contains(@class, 'sweet-alert')]//button[contains(@class, 'confirm')]"),
+                (By.CSS_SELECTOR, ".sweet-alert .sa-confirm-button-container button"),
+                (By.CSS_SELECTOR, ".sweet-alert button.confirm"),
                 (By.XPATH, "//div[contains(@class, 'sweet-alert')]//button[text()='OK']"),
                 (By.XPATH, "//button[text()='OK']")
             ]
@@ -544,52 +682,15 @@ class CheckoutPage(BasePage):
             dict: Order details
         """
         try:
-            # Wait a few seconds for the modal to fully load
-            import time
-            time.sleep(3)
-            
-            order_details = {}
-            
-            # Use the working selector
-            selectors = [
-                (By.XPATH, "//div[contains(@class, 'sweet-alert')]//p[contains(@class, 'text-muted')]"),
-                (By.XPATH, "//div[contains(@class, 'sweet-alert')]//p"),
-                (By.XPATH, "//p[contains(@class, 'text-muted')]")
-            ]
-            
-            order_text = ""
-            for selector in selectors:
-                try:
-                    element = self.find_element(selector)
-                    order_text = element.text
-                    if order_text and order_text.strip():
-                        self.logger.info(f"Found order text with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if not order_text:
-                self.logger.warning("No order details text found")
-                return {}
-            
-            # Parse the order text - it's separated by <br> tags in HTML, so split by newlines
-            lines = order_text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Id:'):
-                    order_details['id'] = line
-                elif line.startswith('Amount:'):
-                    order_details['amount'] = line
-                elif line.startswith('Card Number:'):
-                    order_details['card'] = line
-                elif line.startswith('Name:'):
-                    order_details['name'] = line
-                elif line.startswith('Date:'):
-                    order_details['date'] = line
-            
+            # Read and parse the order text in the browser, waiting until it is filled in
+            order_details = WebDriverWait(self.driver, 5, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+                lambda d: d.execute_script(self.ORDER_DETAILS_SCRIPT)
+            )
             self.logger.info(f"Order details retrieved: {order_details}")
             return order_details
-                
+        except TimeoutException:
+            self.logger.warning("No order details text found")
+            return {}
         except Exception as e:
             self.logger.error(f"Error getting order details: {e}")
             return {}
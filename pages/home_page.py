@@ -5,23 +5,26 @@ Handles navigation and main page elements
 
 import logging
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from config.config import Config
+from utils.cart_cache import invalidate_cart_cache
 
 
 class HomePage(BasePage):
     """Page Object for home page"""
     
     # Main locators
-    LOGO = (By.XPATH, "//a[@class='navbar-brand']")
-    HOME_LINK = (By.XPATH, "//a[text()='Home ']")
+    LOGO = (By.CSS_SELECTOR, "a.navbar-brand")
+    HOME_LINK = (By.CSS_SELECTOR, "#navbarExample a.nav-link[href='index.html']")
     CONTACT_LINK = (By.XPATH, "//a[text()='Contact']")
     ABOUT_US_LINK = (By.XPATH, "//a[text()='About us']")
-    CART_LINK = (By.XPATH, "//a[text()='Cart']")
-    LOGIN_LINK = (By.XPATH, "//a[@id='login2']")
-    LOGOUT_LINK = (By.XPATH, "//a[text()='Log out']")
-    SIGNUP_LINK = (By.XPATH, "//a[@id='signin2']")
+    CART_LINK = (By.CSS_SELECTOR, "#cartur")
+    LOGIN_LINK = (By.CSS_SELECTOR, "#login2")
+    LOGOUT_LINK = (By.CSS_SELECTOR, "#logout2")
+    SIGNUP_LINK = (By.CSS_SELECTOR, "#signin2")
     
     # Product categories
     PHONES_CATEGORY = (By.XPATH, "//a[text()='Phones']")
@@ -29,17 +32,47 @@ class HomePage(BasePage):
     MONITORS_CATEGORY = (By.XPATH, "//a[text()='Monitors']")
     
     # Products on main page
-    PRODUCT_CARDS = (By.XPATH, "//div[@class='card h-100']")
+    PRODUCT_CARDS = (By.CSS_SELECTOR, "#tbodyid .card")
+    PRODUCT_CARDS_FIRST = (By.CSS_SELECTOR, "#tbodyid > :first-child .card")
     PRODUCT_TITLES = (By.CLASS_NAME, "card-title")
     PRODUCT_PRICES = (By.CLASS_NAME, "card-text")
-    ADD_TO_CART_BUTTONS = (By.XPATH, "//a[contains(text(),'Add to cart')]")
+    ADD_TO_CART_BUTTONS = (By.CSS_SELECTOR, "a.btn-success[onclick^='addToCart']")
     
     # Page navigation
-    NEXT_BUTTON = (By.XPATH, "//button[@id='next2']")
-    PREVIOUS_BUTTON = (By.XPATH, "//button[@id='prev2']")
+    NEXT_BUTTON = (By.CSS_SELECTOR, "#next2")
+    PREVIOUS_BUTTON = (By.CSS_SELECTOR, "#prev2")
     
     # Cart
-    CART_COUNT = (By.XPATH, "//a[@id='cartur']")
+    CART_COUNT = (By.CSS_SELECTOR, "#cartur")
+    
+    # Evaluates [strategy, selector] pairs (css or xpath) and returns one visibility flag per pair
+    BATCH_VISIBLE_SCRIPT = """
+        return arguments[0].map(function(locator) {
+            var el = locator[0] === 'xpath'
+                ? document.evaluate(locator[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                : document.querySelector(locator[1]);
+            if (!el || el.getClientRects().length === 0) {
+                return false;
+            }
+            var style = getComputedStyle(el);
+            return style.visibility !== 'hidden' && style.opacity !== '0';
+        });
+    """
+    
+    # Harvests title, numeric price and card element of every product card in one traversal
+    PRODUCTS_SCRIPT = """
+        return Array.from(document.querySelectorAll(arguments[0])).map(function(card) {
+            var title = card.querySelector('.card-title');
+            var price = card.querySelector('.card-text');
+            var priceText = price ? price.innerText : '';
+            var priceMatch = priceText.match(/\\$(\\d+)/);
+            return {
+                title: title ? title.innerText : '',
+                price: priceMatch ? priceMatch[1] : priceText,
+                element: card
+            };
+        });
+    """
     
     def __init__(self, driver):
         super().__init__(driver)
@@ -58,6 +91,45 @@ class HomePage(BasePage):
             self.logger.error(f"Error checking home page load: {e}")
             return False
     
+    def batch_elements_visible(self, locators: list, timeout: int = None) -> list:
+        """
+        Check visibility of several locators with a single script call in the browser
+        
+        Args:
+            locators (list): Tuples (By, selector) using CSS, XPath, ID or class name
+            timeout (int): Time to wait for all locators to be visible
+        
+        Returns:
+            list: One boolean per locator, in the same order
+        """
+        selectors = []
+        for by, selector in locators:
+            if by == By.XPATH:
+                selectors.append(["xpath", selector])
+            elif by == By.ID:
+                selectors.append(["css", f"#{selector}"])
+            elif by == By.CLASS_NAME:
+                selectors.append(["css", f".{selector}"])
+            else:
+                selectors.append(["css", selector])
+        
+        wait_time = timeout or Config.SHORT_WAIT
+        results = [False] * len(selectors)
+        
+        def all_visible(driver):
+            nonlocal results
+            results = driver.execute_script(self.BATCH_VISIBLE_SCRIPT, selectors)
+            return all(results)
+        
+        try:
+            WebDriverWait(self.driver, wait_time, poll_frequency=Config.FAST_POLL_FREQUENCY).until(all_visible)
+        except TimeoutException:
+            hidden = [locator for locator, visible in zip(locators, results) if not visible]
+            self.logger.warning(f"Elements not visible after {wait_time}s: {hidden}")
+        except Exception as e:
+            self.logger.error(f"Error checking elements visibility: {e}")
+        return results
+    
     def navigate_to_home(self) -> bool:
         """
         Navigate to home page
@@ -66,7 +138,8 @@ class HomePage(BasePage):
             bool: True if successful
         """
         try:
-            if self.click_element(self.HOME_LINK):
+            # The home link points to index.html, wait for that document before reporting success
+            if self.click_element(self.HOME_LINK, poll_frequency=Config.FAST_POLL_FREQUENCY) and self.wait_for_url_contains("index.html"):
                 self.wait_for_page_load()
                 self.logger.info("Navigated to home page")
                 return True
@@ -144,6 +217,21 @@ class HomePage(BasePage):
             self.logger.error(f"Error getting products: {e}")
             return []
     
+    def get_products_on_page_fast(self) -> list:
+        """
+        Get all products visible on current page with a single script call
+        
+        Returns:
+            list: List of product information dictionaries, same keys as get_products_on_page
+        """
+        try:
+            products = self.driver.execute_script(self.PRODUCTS_SCRIPT, self.PRODUCT_CARDS[1])
+            self.logger.info(f"Found {len(products)} products on page")
+            return products
+        except Exception as e:
+            self.logger.error(f"Error getting products: {e}")
+            return []
+    
     def search_product_by_name(self, product_name: str) -> bool:
         """
         Search for product by name
@@ -155,7 +243,7 @@ class HomePage(BasePage):
             bool: True if product found
         """
         try:
-            products = self.get_products_on_page()
+            products = self.get_products_on_page_fast()
             for product in products:
                 if product_name.lower() in product['title'].lower():
                     self.logger.info(f"Found product: {product['title']}")
@@ -198,6 +286,7 @@ class HomePage(BasePage):
                     
                     # Execute the JavaScript function directly to add product to cart
                     self.driver.execute_script("addToCart(1);")
+                    invalidate_cart_cache(self.driver)
                     
                     # Handle the alert that appears
                     try:
@@ -266,6 +355,7 @@ class HomePage(BasePage):
             
             # Execute the JavaScript function directly to add product to cart
             self.driver.execute_script("addToCart(1);")
+            invalidate_cart_cache(self.driver)
             
             # Handle the alert that appears
             try:
@@ -406,23 +496,7 @@ class HomePage(BasePage):
             self.logger.error(f"Error getting current URL: {e}")
             return ""
     
-    def refresh_page(self) -> bool:
-        """
-        Refresh current page
-        
-        Returns:
-            bool: True if successful
-        """
-        try:
-            self.driver.refresh()
-            self.wait_for_page_load()
-            self.logger.info("Page refreshed")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error refreshing page: {e}")
-            return False
-    
-    def wait_for_products_to_load(self, timeout: int = 10) -> bool:
+    def wait_for_products_to_load(self, timeout: int = Config.SHORT_WAIT) -> bool:
         """
         Wait for products to load on page
         
@@ -15,12 +15,12 @@ class LoginPage(BasePage):
     """Page Object para el modal de login"""
     
     # Localizadores
-    LOGIN_LINK = (By.XPATH, "//a[@id='login2']")
+    LOGIN_LINK = (By.CSS_SELECTOR, "#login2")
     USERNAME_INPUT = (By.ID, "loginusername")
     PASSWORD_INPUT = (By.ID, "loginpassword")
     LOGIN_BUTTON = (By.XPATH, "//button[text()='Log in']")
     CLOSE_BUTTON = (By.XPATH, "//div[@id='logInModal']//button[text()='Close']")
-    LOGOUT_LINK = (By.XPATH, "//a[text()='Log out']")
+    LOGOUT_LINK = (By.CSS_SELECTOR, "#logout2")
     WELCOME_MESSAGE = (By.XPATH, "//a[@id='nameofuser']")
     MODAL_DIALOG = (By.ID, "logInModal")
     
@@ -17,11 +17,11 @@ class ProductPage(BasePage):
     PRODUCT_TITLE = (By.XPATH, "//h2[@class='name']")
     PRODUCT_PRICE = (By.XPATH, "//h3[@class='price-container']")
     PRODUCT_DESCRIPTION = (By.XPATH, "//div[@id='more-information']")
-    ADD_TO_CART_BUTTON = (By.XPATH, "//a[text()='Add to cart']")
+    ADD_TO_CART_BUTTON = (By.CSS_SELECTOR, "a.btn-success[onclick^='addToCart']")
     
     # Navigation
     BACK_TO_PRODUCTS = (By.XPATH, "//button[text()='Add to cart']/following-sibling::a")
-    HOME_LINK = (By.XPATH, "//a[text()='Home ']")
+    HOME_LINK = (By.CSS_SELECTOR, "#navbarExample a.nav-link[href='index.html']")
     
     # Product image
     PRODUCT_IMAGE = (By.XPATH, "//div[@class='item active']//img")
@@ -86,7 +86,7 @@ class ProductPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.click_element(self.ADD_TO_CART_BUTTON):
+            if self.click_element(self.ADD_TO_CART_BUTTON, poll_frequency=Config.FAST_POLL_FREQUENCY):
                 # Handle alert
                 if self.wait_for_alert(timeout=3):
                     alert_text = self.get_alert_text()
@@ -126,7 +126,8 @@ class ProductPage(BasePage):
             bool: True if successful
         """
         try:
-            if self.click_element(self.HOME_LINK):
+            # The home link points to index.html, wait for that document before reporting success
+            if self.click_element(self.HOME_LINK, poll_frequency=Config.FAST_POLL_FREQUENCY) and self.wait_for_url_contains("index.html"):
                 self.wait_for_page_load()
                 self.logger.info("Navigated to home page")
                 return True
@@ -63,9 +63,9 @@ def run_tests(browser='chrome', headless=True, test_suite='all', parallel=False,
         else:
             cmd.append(f'tests/test_{test_suite}.py')
         
-        # Add parallel execution
+        # Add parallel execution (tests marked serial share the xdist_group "serial" worker)
         if parallel:
-            cmd.extend(['-n', 'auto'])
+            cmd.extend(['-n', 'auto', '--dist=loadgroup'])
         
         # Add reporting
         cmd.extend([
@@ -14,22 +14,16 @@ from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 
 
-def pytest_configure(config):
-    """Initial pytest configuration"""
-    # Create necessary directories
-    os.makedirs(Config.REPORTS_DIR, exist_ok=True)
-    os.makedirs(Config.SCREENSHOTS_DIR, exist_ok=True)
-    os.makedirs(Config.ALLURE_RESULTS_DIR, exist_ok=True)
-    
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, Config.LOG_LEVEL),
-        format=Config.LOG_FORMAT,
-        handlers=[
-            logging.FileHandler('reports/test_execution.log'),
-            logging.StreamHandler()
-        ]
-    )
+# Suite markers keyed by test module name
+_SUITE_MARKERS = {
+    "test_login": pytest.mark.login,
+    "test_cart": pytest.mark.cart,
+    "test_checkout": pytest.mark.checkout,
+    "test_products": pytest.mark.product
+}
+
+# Log level resolved once at import
+_LOG_LEVEL = getattr(logging, Config.LOG_LEVEL)
 
 
 def pytest_addoption(parser):
@@ -72,12 +66,9 @@ def base_url(request):
     return request.config.getoption("--base-url")
 
 
-@pytest.fixture(scope="function")
-def driver(request, browser, headless):
-    """WebDriver fixture for each test"""
-    # Get test name for logging
-    test_name = request.node.name
-    
+@pytest.fixture(scope="session")
+def driver(browser, headless):
+    """WebDriver fixture shared by the whole test session"""
     # Create driver
     driver = driver_factory.create_driver(
         browser=browser,
@@ -88,42 +79,78 @@ def driver(request, browser, headless):
     # Navigate to base URL
     driver.get(Config.BASE_URL)
     
+    yield driver
+    
+    # Cleanup
+    driver_factory.quit_driver()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_http_cache(driver):
+    """Load the cart page once so its static assets are cached for every test"""
+    driver.get(f"{Config.BASE_URL}/cart.html")
+
+
+@pytest.fixture(autouse=True)
+def _reset_browser(request, driver):
+    """Reset browser state before each test"""
+    # Get test name for logging
+    test_name = request.node.name
+    
+    # Browser state is owned by the class-scoped checkout session
+    if "checkout_modal_session" in request.fixturenames:
+        yield
+        return
+    
+    # Close any alert left open by a previous test
+    try:
+        driver.switch_to.alert.accept()
+    except Exception:
+        pass
+    
+    # Clear cookies and web storage so tests don't share cart or session state
+    driver.delete_all_cookies()
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception as e:
+        logging.warning(f"Error clearing web storage: {e}")
+    
+    # Navigate to base URL
+    driver.get(Config.BASE_URL)
+    
     # Take initial screenshot
     if Config.SCREENSHOT_ON_SUCCESS:
         driver.save_screenshot(f"{Config.SCREENSHOTS_DIR}/{test_name}_start.png")
     
-    yield driver
+    yield
     
-    # Cleanup
     try:
         # Take final screenshot
         if Config.SCREENSHOT_ON_SUCCESS:
             driver.save_screenshot(f"{Config.SCREENSHOTS_DIR}/{test_name}_end.png")
     except Exception as e:
         logging.error(f"Error taking final screenshot: {e}")
-    finally:
-        driver_factory.quit_driver()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def login_page(driver):
     """Login page fixture"""
     return LoginPage(driver)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def home_page(driver):
     """Home page fixture"""
     return HomePage(driver)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def cart_page(driver):
     """Cart page fixture"""
     return CartPage(driver)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def checkout_page(driver):
     """Checkout page fixture"""
     return CheckoutPage(driver)
@@ -178,6 +205,19 @@ def logged_in_user(login_page):
         pytest.fail("Failed to login user")
 
 
+@pytest.fixture(scope="module")
+def auth_cookies(driver, login_page):
+    """Cookies of one real login, captured once per module for replay"""
+    driver.get(Config.BASE_URL)
+    if not login_page.login():
+        pytest.fail("Failed to log in to capture auth cookies")
+    
+    # Capture before logout, which only drops the cookie client-side
+    cookies = driver.get_cookies()
+    login_page.logout()
+    return cookies
+
+
 @pytest.fixture(scope="function")
 def cart_with_products(home_page, cart_page):
     """Fixture for cart with products"""
@@ -193,25 +233,53 @@ def cart_with_products(home_page, cart_page):
     yield cart_page
 
 
+@pytest.fixture(scope="session")
+def first_product_name(home_page):
+    """Name of the first home page product, scraped once per session"""
+    home_page.goto(Config.BASE_URL)
+    home_page.wait_for_products_to_load()
+    
+    products = home_page.get_products_on_page_fast()
+    if not products:
+        pytest.fail("No products found on home page")
+    return products[0]['title']
+
+
+@pytest.fixture(scope="function")
+def cart_with_one_product(home_page, first_product_name):
+    """Fixture for cart with the first home page product, returns its name"""
+    product_name = first_product_name
+    home_page.goto(Config.BASE_URL)
+    home_page.wait_for_products_to_load()
+    
+    if not home_page.add_product_to_cart(product_name):
+        pytest.fail(f"Failed to add {product_name} to cart")
+    if not home_page.go_to_cart():
+        pytest.fail("Failed to navigate to cart")
+    
+    logging.info(f"Added {product_name} to cart")
+    return product_name
+
+
+@pytest.fixture(scope="class")
+def checkout_modal_session(driver, cart_page, checkout_page):
+    """Cart with one product and the checkout modal opened once per class, for read-only tests"""
+    driver.delete_all_cookies()
+    if not cart_page.seed_cart([1]):
+        pytest.fail("Failed to add product to cart")
+    
+    if not checkout_page.proceed_to_checkout():
+        pytest.fail("Failed to open checkout modal")
+    
+    yield driver, checkout_page
+
+
 @pytest.fixture(scope="function")
 def checkout_data():
     """Fixture for checkout test data"""
     return Config.TEST_DATA["shipping"]
 
 
-def pytest_runtest_setup(item):
-    """Setup before each test runs"""
-    # Add markers based on test file
-    if "test_login" in item.nodeid:
-        item.add_marker(pytest.mark.login)
-    elif "test_cart" in item.nodeid:
-        item.add_marker(pytest.mark.cart)
-    elif "test_checkout" in item.nodeid:
-        item.add_marker(pytest.mark.checkout)
-    elif "test_products" in item.nodeid:
-        item.add_marker(pytest.mark.product)
-
-
 def pytest_runtest_teardown(item, nextitem):
     """Teardown after each test runs"""
     # Take screenshot on failure
@@ -224,16 +292,50 @@ def pytest_runtest_teardown(item, nextitem):
             logging.error(f"Error taking failure screenshot: {e}")
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection"""
-    # Add smoke marker to login tests
+    """Modify test collection (runs before xdist reads the xdist_group markers)"""
     for item in items:
-        if "test_login" in item.nodeid and "test_successful_login" in item.nodeid:
+        # Add suite marker based on test file (once per collection, not per run)
+        module_name = os.path.splitext(os.path.basename(item.nodeid.split("::", 1)[0]))[0]
+        suite_marker = _SUITE_MARKERS.get(module_name)
+        if suite_marker:
+            item.add_marker(suite_marker)
+        
+        # Add smoke marker to login tests
+        if module_name == "test_login" and "test_successful_login" in item.nodeid:
             item.add_marker(pytest.mark.smoke)
+        
+        # Keep serial tests on one worker when running with --dist=loadgroup
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group(name="serial"))
 
 
 def pytest_configure(config):
     """Configure pytest"""
+    # Create necessary directories
+    os.makedirs(Config.REPORTS_DIR, exist_ok=True)
+    os.makedirs(Config.SCREENSHOTS_DIR, exist_ok=True)
+    os.makedirs(Config.ALLURE_RESULTS_DIR, exist_ok=True)
+    
+    # Configure logging (one log file per xdist worker to avoid shared writers)
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    log_suffix = f"_{worker_id}" if worker_id else ""
+    logging.basicConfig(
+        level=_LOG_LEVEL,
+        format=Config.LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(f"{Config.REPORTS_DIR}/test_execution{log_suffix}.log"),
+            logging.StreamHandler()
+        ]
+    )
+    
+    # Same for pytest's log_file: runs before the logging plugin (trylast) opens it
+    log_file = config.getoption("log_file") or config.getini("log_file")
+    if worker_id and log_file:
+        log_root, log_ext = os.path.splitext(log_file)
+        config.option.log_file = f"{log_root}{log_suffix}{log_ext}"
+    
     # Register custom markers
     config.addinivalue_line(
         "markers", "login: Tests related to login functionality"
@@ -254,5 +356,8 @@ def pytest_configure(config):
         "markers", "regression: Regression tests"
     )
     config.addinivalue_line(
-        "markers", "slow: Tests that take a long time to execute"
+        "markers", "slow: Slow or redundant coverage, skipped on push and run nightly"
+    )
+    config.addinivalue_line(
+        "markers", "serial: Tests that share login or cart state and must run on a single worker"
     )
\ No newline at end of file
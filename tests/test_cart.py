@@ -6,6 +6,8 @@ import pytest
 import logging
 from config.config import Config
 
+logger = logging.getLogger(__name__)
+
 
 class TestCart:
     """Test class for cart functionality"""
@@ -14,12 +16,12 @@ class TestCart:
         """
         Test: Cart page loading
         
-        Verifies that the cart page loads correctly.
+        Verifies that the cart page loads correctly and is empty initially.
         """
-        logging.info("Starting cart page loading test")
+        logger.info("Starting cart page loading test")
         
         # Navigate to cart
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        cart_page.goto(f"{Config.BASE_URL}/cart.html")
         
         # Verify page is loaded
         assert cart_page.is_cart_page_loaded(), "Cart page should load correctly"
@@ -27,19 +29,6 @@ class TestCart:
         # Verify main elements
         assert cart_page.is_element_present(cart_page.CART_TITLE), "Cart title should be present"
         
-        logging.info("Cart page loading test completed")
-    
-    def test_empty_cart_display(self, driver, cart_page):
-        """
-        Test: Empty cart display
-        
-        Verifies that empty cart is displayed correctly.
-        """
-        logging.info("Starting empty cart test")
-        
-        # Navigate to cart
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        
         # Verify cart is empty
         assert cart_page.is_cart_empty(), "Cart should be empty initially"
         
@@ -51,30 +40,21 @@ class TestCart:
         cart_count = cart_page.get_cart_count()
         assert cart_count == 0, f"Cart count should be 0, got {cart_count}"
         
-        logging.info("Empty cart test completed")
+        # Verify total is 0
+        total = cart_page.get_cart_total_numeric()
+        assert total == 0, f"Total should be 0, got {total}"
+        
+        logger.info("Cart page loading test completed")
     
-    def test_add_products_to_cart_and_verify(self, driver, home_page, cart_page):
+    def test_add_products_to_cart_and_verify(self, cart_page, cart_with_one_product, first_product_name):
         """
         Test: Add products to cart and verify
         
         Verifies that products can be added to cart and displayed correctly.
         """
-        logging.info("Starting add products to cart test")
-        
-        # Add one product to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        all_products = home_page.get_products_on_page()
-        
-        # Add first product
-        product_name = all_products[0]['title']
-        logging.info(f"Adding product: {product_name}")
+        logger.info("Starting add products to cart test")
         
-        # Add product to cart
-        assert home_page.add_product_to_cart(product_name), f"Should add product: {product_name}"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
+        product_name = first_product_name
         
         # Verify products in cart
         cart_products = cart_page.get_cart_products()
@@ -84,25 +64,15 @@ class TestCart:
         cart_titles = [product['title'] for product in cart_products]
         assert product_name in cart_titles, f"Cart should contain {product_name}, got {cart_titles}"
         
-        logging.info("Add products to cart test completed")
+        logger.info("Add products to cart test completed")
     
-    def test_cart_product_information(self, driver, home_page, cart_page):
+    def test_cart_product_information(self, cart_page, cart_with_one_product):
         """
         Test: Cart product information
         
         Verifies that product information is displayed correctly in cart.
         """
-        logging.info("Starting cart product information test")
-        
-        # Add a product to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        
-        # Add first product to cart
-        assert home_page.add_first_product_to_cart(), "Should add first product to cart"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
+        logger.info("Starting cart product information test")
         
         # Verify product information in cart
         cart_products = cart_page.get_cart_products()
@@ -113,25 +83,15 @@ class TestCart:
         assert cart_product['price'], "Product should have a price"
         assert cart_product['delete_button'], "Product should have a delete button"
         
-        logging.info("Cart product information test completed")
+        logger.info("Cart product information test completed")
     
-    def test_delete_product_from_cart(self, driver, home_page, cart_page):
+    def test_delete_product_from_cart(self, cart_page, cart_with_one_product):
         """
         Test: Delete product from cart
         
         Verifies that products can be deleted from cart.
         """
-        logging.info("Starting delete product from cart test")
-        
-        # Add products to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        
-        # Add first product
-        assert home_page.add_first_product_to_cart(), "Should add first product to cart"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
+        logger.info("Starting delete product from cart test")
         
         # Get initial count
         initial_count = cart_page.get_cart_count()
@@ -144,35 +104,18 @@ class TestCart:
         new_count = cart_page.get_cart_count()
         assert new_count == initial_count - 1, f"Cart count should decrease from {initial_count} to {new_count}"
         
-        logging.info("Delete product from cart test completed")
+        logger.info("Delete product from cart test completed")
     
-    def test_delete_product_by_name(self, driver, home_page, cart_page):
+    @pytest.mark.slow
+    def test_delete_product_by_name(self, cart_page, cart_with_one_product, first_product_name):
         """
         Test: Delete product by name
         
         Verifies that products can be deleted by name.
         """
-        logging.info("Starting delete product by name test")
-        
-        # Add specific product to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        
-        # Get first product name
-        products = home_page.get_products_on_page()
-        assert len(products) > 0, "Should have products on page"
-        
-        product_name = products[0]['title']
+        logger.info("Starting delete product by name test")
         
-        # Add to cart
-        assert home_page.add_product_to_cart(product_name), f"Should add product: {product_name}"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
-        
-        # Verify product is in cart
-        cart_products = cart_page.get_cart_products()
-        assert len(cart_products) > 0, "Should have products in cart"
+        product_name = first_product_name
         
         # Delete by name
         assert cart_page.delete_product_by_name(product_name), f"Should delete product: {product_name}"
@@ -181,25 +124,15 @@ class TestCart:
         new_cart_products = cart_page.get_cart_products()
         assert len(new_cart_products) == 0, "Cart should be empty after deletion"
         
-        logging.info("Delete product by name test completed")
+        logger.info("Delete product by name test completed")
     
-    def test_cart_total_calculation(self, driver, home_page, cart_page):
+    def test_cart_total_calculation(self, cart_page, cart_with_one_product):
         """
         Test: Cart total calculation
         
         Verifies that cart total is calculated correctly.
         """
-        logging.info("Starting cart total calculation test")
-        
-        # Add one product to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        
-        # Add first product
-        assert home_page.add_first_product_to_cart(), "Should add first product to cart"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
+        logger.info("Starting cart total calculation test")
         
         # Get cart products
         cart_products = cart_page.get_cart_products()
@@ -211,23 +144,19 @@ class TestCart:
         # Verify total
         assert cart_page.verify_total_price(expected_total), f"Cart total should be {expected_total}"
         
-        logging.info("Cart total calculation test completed")
+        logger.info("Cart total calculation test completed")
     
-    def test_clear_cart(self, driver, home_page, cart_page):
+    @pytest.mark.slow
+    def test_clear_cart(self, home_page, cart_page):
         """
         Test: Clear cart
         
         Verifies that cart can be cleared completely.
         """
-        logging.info("Starting clear cart test")
-        
-        # Add products to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
+        logger.info("Starting clear cart test")
         
         # Add multiple products
-        for i in range(3):
-            assert home_page.add_first_product_to_cart(), f"Should add product {i+1}"
+        assert cart_page.seed_cart([1, 2, 3]), "Should add products to cart"
         
         # Navigate to cart
         assert home_page.go_to_cart(), "Should navigate to cart"
@@ -245,34 +174,20 @@ class TestCart:
         final_count = cart_page.get_cart_count()
         assert final_count == 0, f"Cart count should be 0, got {final_count}"
         
-        logging.info("Clear cart test completed")
+        logger.info("Clear cart test completed")
     
-    def test_place_order_button(self, driver, home_page, cart_page):
+    def test_place_order_button(self, cart_page, cart_with_one_product):
         """
         Test: Place order button
         
         Verifies that place order button is present and clickable.
         """
-        logging.info("Starting place order button test")
-        
-        # Add product to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        assert home_page.add_first_product_to_cart(), "Should add product to cart"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
-        
-        # Verify place order button is present
-        assert cart_page.is_element_present(cart_page.PLACE_ORDER_BUTTON), "Place order button should be present"
-        
-        # Verify button is clickable
-        assert cart_page.is_element_clickable(cart_page.PLACE_ORDER_BUTTON), "Place order button should be clickable"
+        logger.info("Starting place order button test")
         
-        # Click place order button
-        assert cart_page.place_order(), "Should be able to click place order button"
+        # Wait for place order button to be clickable and click it
+        assert cart_page.place_order(), "Place order button should be present and clickable"
         
-        logging.info("Place order button test completed")
+        logger.info("Place order button test completed")
     
     def test_cart_navigation(self, driver, cart_page):
         """
@@ -280,10 +195,10 @@ class TestCart:
         
         Verifies navigation from cart page.
         """
-        logging.info("Starting cart navigation test")
+        logger.info("Starting cart navigation test")
         
         # Navigate to cart
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        cart_page.goto(f"{Config.BASE_URL}/cart.html")
         
         # Verify cart page loaded
         assert cart_page.is_cart_page_loaded(), "Cart page should load"
@@ -291,27 +206,23 @@ class TestCart:
         # Navigate to home
         assert cart_page.go_to_home(), "Should navigate to home from cart"
         
-        # Verify home page loaded
+        # Verify the browser left the cart for the home page
         current_url = cart_page.get_current_url()
-        assert Config.BASE_URL in current_url, f"Should be on home page, current URL: {current_url}"
+        assert current_url.endswith("index.html"), f"Should be on home page, current URL: {current_url}"
         
-        logging.info("Cart navigation test completed")
+        logger.info("Cart navigation test completed")
     
-    def test_cart_summary(self, driver, home_page, cart_page):
+    @pytest.mark.slow
+    def test_cart_summary(self, home_page, cart_page):
         """
         Test: Cart summary
         
         Verifies that cart summary provides correct information.
         """
-        logging.info("Starting cart summary test")
-        
-        # Add products to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
+        logger.info("Starting cart summary test")
         
         # Add multiple products
-        for i in range(2):
-            assert home_page.add_first_product_to_cart(), f"Should add product {i+1}"
+        assert cart_page.seed_cart([1, 2]), "Should add products to cart"
         
         # Navigate to cart
         assert home_page.go_to_cart(), "Should navigate to cart"
@@ -324,8 +235,8 @@ class TestCart:
         assert summary['total'] > 0, "Should have total price in summary"
         assert not summary['is_empty'], "Cart should not be empty"
         
-        logging.info(f"Cart summary: {summary['product_count']} products, total: {summary['total']}")
-        logging.info("Cart summary test completed")
+        logger.info("Cart summary: %s products, total: %s", summary['product_count'], summary['total'])
+        logger.info("Cart summary test completed")
     
     def test_cart_page_elements_visibility(self, driver, cart_page):
         """
@@ -333,74 +244,43 @@ class TestCart:
         
         Verifies that all cart page elements are visible.
         """
-        logging.info("Starting cart page elements visibility test")
+        logger.info("Starting cart page elements visibility test")
         
         # Navigate to cart
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        cart_page.goto(f"{Config.BASE_URL}/cart.html")
         
         # Verify main elements are visible
-        main_elements = [
-            cart_page.CART_TITLE,
-            cart_page.PLACE_ORDER_BUTTON
-        ]
-        
-        for element in main_elements:
-            assert cart_page.is_element_visible(element), f"Element should be visible: {element}"
-        
-        logging.info("Cart page elements visibility test completed")
-    
-    def test_cart_with_no_products(self, driver, cart_page):
-        """
-        Test: Cart with no products
+        visible_elements = cart_page.wait_for_all_elements_visible(cart_page.MAIN_ELEMENTS)
+        assert len(visible_elements) == 2, f"Cart title and place order button should be visible, got {len(visible_elements)}"
         
-        Verifies cart behavior when empty.
-        """
-        logging.info("Starting cart with no products test")
-        
-        # Navigate to cart
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        
-        # Verify cart is empty
-        assert cart_page.is_cart_empty(), "Cart should be empty"
-        
-        # Verify no products
-        products = cart_page.get_cart_products()
-        assert len(products) == 0, "Should have no products"
-        
-        # Verify total is 0
-        total = cart_page.get_cart_total_numeric()
-        assert total == 0, f"Total should be 0, got {total}"
-        
-        logging.info("Cart with no products test completed")
+        logger.info("Cart page elements visibility test completed")
     
-    def test_cart_persistence(self, driver, home_page, cart_page):
+    @pytest.mark.slow
+    def test_cart_persistence(self, driver, cart_page, cart_with_one_product):
         """
         Test: Cart persistence
         
         Verifies that cart contents persist across page navigation.
         """
-        logging.info("Starting cart persistence test")
-        
-        # Add product to cart
-        driver.get(Config.BASE_URL)
-        home_page.wait_for_products_to_load()
-        assert home_page.add_first_product_to_cart(), "Should add product to cart"
-        
-        # Navigate to cart
-        assert home_page.go_to_cart(), "Should navigate to cart"
+        logger.info("Starting cart persistence test")
         
         # Verify product is in cart
         cart_products = cart_page.get_cart_products()
         assert len(cart_products) > 0, "Should have products in cart"
         
-        # Navigate back to home
-        assert cart_page.go_to_home(), "Should navigate to home"
+        # Cart is stored server-side under the "user" cookie
+        cart_cookie_before = driver.get_cookie("user")
+        
+        # Navigate away and back directly
+        driver.get(Config.BASE_URL)
+        driver.get(f"{Config.BASE_URL}/cart.html")
         
-        # Navigate back to cart
-        assert home_page.go_to_cart(), "Should navigate to cart again"
+        # Verify cart key is unchanged
+        cart_cookie_after = driver.get_cookie("user")
+        assert cart_cookie_before == cart_cookie_after, "Cart cookie should persist across navigation"
         
         # Verify product is still in cart
         cart_products_after = cart_page.get_cart_products()
         assert len(cart_products_after) > 0, "Product should persist in cart"
         
-        logging.info("Cart persistence test completed")
\ No newline at end of file
+        logger.info("Cart persistence test completed")
\ No newline at end of file
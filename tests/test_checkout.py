@@ -4,47 +4,15 @@ Test cases for Checkout functionality
 
 import pytest
 import logging
-from selenium.webdriver.common.by import By
 from config.config import Config
 
+SHIPPING_DATA = Config.TEST_DATA["shipping"]
+
 
 class TestCheckout:
     """Test class for checkout functionality"""
     
-    def test_checkout_modal_loading(self, driver, checkout_page, cart_with_products):
-        """
-        Test: Checkout modal loading
-        
-        Verifies that checkout modal opens correctly when proceeding from cart.
-        """
-        logging.info("Starting checkout modal loading test")
-        
-        # Navigate to cart
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        
-        # Proceed to checkout
-        assert checkout_page.proceed_to_checkout(), "Should be able to proceed to checkout"
-        
-        # Verify modal is visible
-        assert checkout_page.is_checkout_modal_visible(), "Checkout modal should be visible"
-        
-        # Verify form elements
-        form_elements = [
-            checkout_page.NAME_INPUT,
-            checkout_page.COUNTRY_INPUT,
-            checkout_page.CITY_INPUT,
-            checkout_page.CREDIT_CARD_INPUT,
-            checkout_page.MONTH_INPUT,
-            checkout_page.YEAR_INPUT,
-            checkout_page.PURCHASE_BUTTON
-        ]
-        
-        for element in form_elements:
-            assert checkout_page.is_element_present(element), f"Form element should be present: {element}"
-        
-        logging.info("Checkout modal loading test completed")
-    
-    def test_checkout_form_validation(self, driver, checkout_page, cart_with_products):
+    def test_checkout_form_validation(self, checkout_page, cart_with_products):
         """
         Test: Checkout form validation
         
@@ -52,8 +20,7 @@ class TestCheckout:
         """
         logging.info("Starting checkout form validation test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Try to submit empty form
@@ -64,7 +31,7 @@ class TestCheckout:
         
         logging.info("Checkout form validation test completed")
     
-    def test_checkout_form_filling(self, driver, checkout_page, cart_with_products):
+    def test_checkout_form_filling(self, checkout_page, cart_with_products):
         """
         Test: Checkout form filling
         
@@ -72,12 +39,11 @@ class TestCheckout:
         """
         logging.info("Starting checkout form filling test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Fill form with test data
-        form_data = Config.TEST_DATA["shipping"]
+        form_data = SHIPPING_DATA
         assert checkout_page.fill_checkout_form(form_data), "Should fill checkout form"
         
         # Verify form is complete
@@ -85,7 +51,7 @@ class TestCheckout:
         
         logging.info("Checkout form filling test completed")
     
-    def test_checkout_complete_purchase(self, driver, checkout_page, cart_with_products):
+    def test_checkout_complete_purchase(self, checkout_page, cart_with_products):
         """
         Test: Complete purchase process
         
@@ -93,8 +59,7 @@ class TestCheckout:
         """
         logging.info("Starting complete purchase test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Complete purchase
@@ -112,7 +77,7 @@ class TestCheckout:
         
         logging.info("Complete purchase test completed")
     
-    def test_checkout_order_details(self, driver, checkout_page, cart_with_products):
+    def test_checkout_order_details(self, checkout_page, cart_with_products):
         """
         Test: Order details display
         
@@ -120,8 +85,7 @@ class TestCheckout:
         """
         logging.info("Starting order details test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Complete purchase
@@ -143,7 +107,7 @@ class TestCheckout:
         logging.info(f"Order details: {order_details}")
         logging.info("Order details test completed")
     
-    def test_checkout_form_individual_fields(self, driver, checkout_page, cart_with_products):
+    def test_checkout_form_individual_fields(self, checkout_page, cart_with_products):
         """
         Test: Individual form fields
         
@@ -151,12 +115,11 @@ class TestCheckout:
         """
         logging.info("Starting individual form fields test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Test each field individually
-        test_data = Config.TEST_DATA["shipping"]
+        test_data = SHIPPING_DATA
         
         # Test name field
         assert checkout_page.fill_name(test_data['name']), "Should fill name field"
@@ -178,7 +141,8 @@ class TestCheckout:
         
         logging.info("Individual form fields test completed")
     
-    def test_checkout_modal_close(self, driver, checkout_page, cart_with_products):
+    @pytest.mark.slow
+    def test_checkout_modal_close(self, checkout_page, cart_with_products):
         """
         Test: Checkout modal close
         
@@ -186,8 +150,7 @@ class TestCheckout:
         """
         logging.info("Starting checkout modal close test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Verify modal is visible
@@ -208,7 +171,7 @@ class TestCheckout:
         
         logging.info("Checkout modal close test completed")
     
-    def test_checkout_error_handling(self, driver, checkout_page, cart_with_products):
+    def test_checkout_error_handling(self, checkout_page, cart_with_products):
         """
         Test: Checkout error handling
         
@@ -216,8 +179,7 @@ class TestCheckout:
         """
         logging.info("Starting checkout error handling test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Try to submit empty form
@@ -230,7 +192,7 @@ class TestCheckout:
         
         logging.info("Checkout error handling test completed")
     
-    def test_checkout_form_clear(self, driver, checkout_page, cart_with_products):
+    def test_checkout_form_clear(self, checkout_page, cart_with_products):
         """
         Test: Checkout form clear
         
@@ -238,12 +200,11 @@ class TestCheckout:
         """
         logging.info("Starting checkout form clear test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Fill form
-        form_data = Config.TEST_DATA["shipping"]
+        form_data = SHIPPING_DATA
         assert checkout_page.fill_checkout_form(form_data), "Should fill form"
         
         # Verify form is filled
@@ -257,7 +218,8 @@ class TestCheckout:
         
         logging.info("Checkout form clear test completed")
     
-    def test_checkout_confirmation_ok(self, driver, checkout_page, cart_with_products):
+    @pytest.mark.slow
+    def test_checkout_confirmation_ok(self, checkout_page, cart_with_products):
         """
         Test: Checkout confirmation OK
         
@@ -265,8 +227,7 @@ class TestCheckout:
         """
         logging.info("Starting checkout confirmation OK test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Complete purchase
@@ -280,7 +241,7 @@ class TestCheckout:
         
         logging.info("Checkout confirmation OK test completed")
     
-    def test_checkout_with_different_data(self, driver, checkout_page, cart_with_products):
+    def test_checkout_with_different_data(self, checkout_page, cart_with_products):
         """
         Test: Checkout with different data
         
@@ -288,8 +249,7 @@ class TestCheckout:
         """
         logging.info("Starting checkout with different data test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Test with different data
@@ -313,75 +273,8 @@ class TestCheckout:
         
         logging.info("Checkout with different data test completed")
     
-    def test_checkout_form_required_fields(self, driver, checkout_page, cart_with_products):
-        """
-        Test: Checkout form required fields
-        
-        Verifies that all required fields are present and functional.
-        """
-        logging.info("Starting checkout form required fields test")
-        
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
-        
-        # Verify all required fields are present
-        required_fields = [
-            checkout_page.NAME_INPUT,
-            checkout_page.COUNTRY_INPUT,
-            checkout_page.CITY_INPUT,
-            checkout_page.CREDIT_CARD_INPUT,
-            checkout_page.MONTH_INPUT,
-            checkout_page.YEAR_INPUT
-        ]
-        
-        for field in required_fields:
-            assert checkout_page.is_element_present(field), f"Required field should be present: {field}"
-            assert checkout_page.is_element_visible(field), f"Required field should be visible: {field}"
-        
-        logging.info("Checkout form required fields test completed")
-    
-    def test_checkout_modal_elements_visibility(self, driver, checkout_page, cart_with_products):
-        """
-        Test: Checkout modal elements visibility
-        
-        Verifies that all modal elements are visible.
-        """
-        logging.info("Starting checkout modal elements visibility test")
-        
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
-        
-        # Verify modal elements are visible
-        modal_elements = [
-            checkout_page.MODAL_TITLE,
-            checkout_page.NAME_INPUT,
-            checkout_page.COUNTRY_INPUT,
-            checkout_page.CITY_INPUT,
-            checkout_page.CREDIT_CARD_INPUT,
-            checkout_page.MONTH_INPUT,
-            checkout_page.YEAR_INPUT,
-            checkout_page.PURCHASE_BUTTON
-        ]
-        
-        for element in modal_elements:
-            assert checkout_page.is_element_visible(element), f"Modal element should be visible: {element}"
-        
-        # Check if close button is present (may not be visible immediately)
-        close_button_present = checkout_page.is_element_present(checkout_page.CLOSE_BUTTON)
-        logging.info(f"Close button present: {close_button_present}")
-        
-        # Also check for X button as alternative
-        x_button_present = checkout_page.is_element_present((By.XPATH, "//div[@id='orderModal']//button[@class='close']"))
-        logging.info(f"X button present: {x_button_present}")
-        
-        # At least one close mechanism should be present
-        assert close_button_present or x_button_present, "At least one close button should be present"
-        
-        logging.info("Checkout modal elements visibility test completed")
-    
-    def test_checkout_purchase_button_functionality(self, driver, checkout_page, cart_with_products):
+    @pytest.mark.slow
+    def test_checkout_purchase_button_functionality(self, checkout_page, cart_with_products):
         """
         Test: Purchase button functionality
         
@@ -389,12 +282,11 @@ class TestCheckout:
         """
         logging.info("Starting purchase button functionality test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Fill form
-        form_data = Config.TEST_DATA["shipping"]
+        form_data = SHIPPING_DATA
         assert checkout_page.fill_checkout_form(form_data), "Should fill form"
         
         # Verify purchase button is clickable
@@ -405,7 +297,7 @@ class TestCheckout:
         
         logging.info("Purchase button functionality test completed")
     
-    def test_checkout_complete_flow(self, driver, checkout_page, cart_with_products):
+    def test_checkout_complete_flow(self, checkout_page, cart_with_products):
         """
         Test: Complete checkout flow
         
@@ -413,17 +305,19 @@ class TestCheckout:
         """
         logging.info("Starting complete checkout flow test")
         
-        # Navigate to cart and proceed to checkout
-        driver.get(f"{Config.BASE_URL}/cart.html")
+        # Proceed to checkout (navigates to cart if needed)
         assert checkout_page.proceed_to_checkout(), "Should proceed to checkout"
         
         # Verify modal is visible
         assert checkout_page.is_checkout_modal_visible(), "Modal should be visible"
         
         # Fill form
-        form_data = Config.TEST_DATA["shipping"]
+        form_data = SHIPPING_DATA
         assert checkout_page.fill_checkout_form(form_data), "Should fill form"
         
+        # Verify purchase button is clickable
+        assert checkout_page.is_element_clickable(checkout_page.PURCHASE_BUTTON), "Purchase button should be clickable"
+        
         # Complete purchase
         assert checkout_page.complete_purchase(), "Should complete purchase"
         
@@ -437,4 +331,47 @@ class TestCheckout:
         # Click OK to complete
         assert checkout_page.click_confirmation_ok(), "Should click OK"
         
+        # Close the checkout modal
+        assert checkout_page.close_checkout_modal(), "Should close modal"
+        assert not checkout_page.is_checkout_modal_visible(), "Modal should be closed"
+        
         logging.info("Complete checkout flow test completed")
+
+
+class TestCheckoutModal:
+    """Read-only checks sharing one opened checkout modal per class"""
+    
+    def test_checkout_modal_static_assertions(self, checkout_modal_session):
+        """
+        Test: Checkout modal static assertions
+        
+        Verifies that the checkout modal opens from the cart with its title,
+        required fields, purchase button and a close mechanism visible.
+        """
+        logging.info("Starting checkout modal static assertions test")
+        
+        driver, checkout_page = checkout_modal_session
+        
+        # Verify modal is visible
+        assert checkout_page.is_checkout_modal_visible(), "Checkout modal should be visible"
+        
+        # Verify title, required fields and purchase button are visible in a single browser call
+        modal_elements = (
+            [checkout_page.MODAL_TITLE_SELECTOR]
+            + checkout_page.FORM_INPUT_SELECTORS
+            + [checkout_page.PURCHASE_BUTTON_SELECTOR]
+        )
+        visible = checkout_page.batch_elements_present(modal_elements, visible=True)
+        assert all(visible), f"Modal elements should be visible: {dict(zip(modal_elements, visible))}"
+        
+        # Check the Close and X buttons together (may not be visible immediately)
+        close_button_present, x_button_present = checkout_page.batch_elements_present(
+            [checkout_page.CLOSE_BUTTON_SELECTOR, checkout_page.X_BUTTON_SELECTOR], timeout=2
+        )
+        logging.info(f"Close button present: {close_button_present}")
+        logging.info(f"X button present: {x_button_present}")
+        
+        # At least one close mechanism should be present
+        assert close_button_present or x_button_present, "At least one close button should be present"
+        
+        logging.info("Checkout modal static assertions test completed")
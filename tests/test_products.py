@@ -4,8 +4,10 @@ Test cases for Product functionality
 
 import pytest
 import logging
-from selenium.webdriver.common.by import By
 from config.config import Config
+from utils.cart_cache import get_cart_items
+
+logger = logging.getLogger(__name__)
 
 
 class TestProducts:
@@ -17,7 +19,7 @@ class TestProducts:
         
         Verifies that the home page loads correctly with all main elements.
         """
-        logging.info("Starting home page loading test")
+        logger.info("Starting home page loading test")
         
         # Verify page is loaded
         assert home_page.is_home_page_loaded(), "Home page should load correctly"
@@ -27,85 +29,50 @@ class TestProducts:
         assert home_page.is_element_present(home_page.LAPTOPS_CATEGORY), "Laptops category should be present"
         assert home_page.is_element_present(home_page.MONITORS_CATEGORY), "Monitors category should be present"
         
-        logging.info("Home page loading test completed")
+        logger.info("Home page loading test completed")
     
-    def test_product_categories_navigation(self, driver, home_page):
+    @pytest.mark.parametrize("category", ['phones', 'laptops', 'monitors'])
+    def test_product_categories_navigation(self, driver, home_page, category):
         """
         Test: Product categories navigation
         
-        Verifies navigation between different product categories.
-        """
-        logging.info("Starting categories navigation test")
-        
-        # Test each category
-        categories = ['phones', 'laptops', 'monitors']
-        
-        for category in categories:
-            logging.info(f"Testing category: {category}")
-            
-            # Select category
-            assert home_page.select_category(category), f"Should be able to select category {category}"
-            
-            # Verify products are loaded
-            assert home_page.wait_for_products_to_load(), f"Products should load for category {category}"
-            
-            # Verify products are present
-            products = home_page.get_products_on_page()
-            assert len(products) > 0, f"Should have products in category {category}"
-            
-            logging.info(f"Category {category} test completed")
-        
-        logging.info("Categories navigation test completed")
-    
-    def test_add_products_to_cart(self, driver, home_page):
-        """
-        Test: Add products to cart
-        
-        Verifies that products can be added to cart successfully.
+        Verifies navigation to each product category.
         """
-        logging.info("Starting add products to cart test")
+        logger.info("Starting categories navigation test: %s", category)
         
-        # Get initial cart count
-        initial_count = home_page.get_cart_count()
-        logging.info(f"Initial cart count: {initial_count}")
+        # Select category
+        assert home_page.select_category(category), f"Should be able to select category {category}"
         
-        # Add first product to cart
-        assert home_page.add_first_product_to_cart(), "Should be able to add first product to cart"
+        # Verify products are loaded
+        assert home_page.wait_for_products_to_load(), f"Products should load for category {category}"
         
-        # Verify product was added to cart by checking cart page
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        cart_items = driver.find_elements(By.XPATH, "//tbody[@id='tbodyid']//tr")
-        assert len(cart_items) > 0, "Product should be in cart"
+        # Verify products are present
+        products = home_page.get_products_on_page()
+        assert len(products) > 0, f"Should have products in category {category}"
         
-        logging.info(f"Cart items after adding product: {len(cart_items)}")
-        logging.info("Add products to cart test completed")
+        logger.info("Category %s test completed", category)
     
-    def test_add_multiple_products_to_cart(self, driver, home_page):
+    @pytest.mark.serial
+    @pytest.mark.parametrize("n", [1, 3])
+    def test_add_products_to_cart(self, driver, home_page, n):
         """
-        Test: Add multiple products to cart
+        Test: Add products to cart
         
-        Verifies that multiple products can be added to cart.
+        Verifies that one or several products can be added to cart successfully.
         """
-        logging.info("Starting add multiple products test")
+        logger.info("Starting add products to cart test with %d products", n)
         
-        # Get initial cart count
-        initial_count = home_page.get_cart_count()
-        logging.info(f"Initial cart count: {initial_count}")
-        
-        # Add multiple products
-        products_to_add = 3
-        for i in range(products_to_add):
-            logging.info(f"Adding product {i+1} to cart")
+        # Add products (the per-test reset leaves an empty cart)
+        for i in range(n):
+            logger.debug("Adding product %d to cart", i + 1)
             assert home_page.add_first_product_to_cart(), f"Should be able to add product {i+1}"
         
-        # Verify products were added to cart by checking cart page
-        driver.get(f"{Config.BASE_URL}/cart.html")
-        cart_items = driver.find_elements(By.XPATH, "//tbody[@id='tbodyid']//tr")
-        assert len(cart_items) > 0, f"Should have items in cart, got {len(cart_items)}"
-        assert len(cart_items) >= 1, f"Should have at least 1 item in cart, got {len(cart_items)}"
+        # Verify products were added to cart
+        cart_items = get_cart_items(driver)
+        assert cart_items >= n, f"Should have at least {n} items in cart, got {cart_items}"
         
-        logging.info(f"Final cart items: {len(cart_items)}")
-        logging.info("Add multiple products test completed")
+        logger.info("Final cart items: %s", cart_items)
+        logger.info("Add products to cart test completed")
     
     def test_product_search_functionality(self, driver, home_page):
         """
@@ -113,21 +80,22 @@ class TestProducts:
         
         Verifies that products can be searched by name.
         """
-        logging.info("Starting product search test")
+        logger.info("Starting product search test")
         
-        # Get products on page
-        products = home_page.get_products_on_page()
+        # Wait for the product list rendered after page load, then read it
+        assert home_page.wait_for_products_to_load(), "Products should load"
+        products = home_page.get_products_on_page_fast()
         assert len(products) > 0, "Should have products on page"
         
         # Test search for first product
         first_product = products[0]
         product_name = first_product['title']
-        logging.info(f"Searching for product: {product_name}")
+        logger.info("Searching for product: %s", product_name)
         
         # Search for product
         assert home_page.search_product_by_name(product_name), f"Should find product: {product_name}"
         
-        logging.info("Product search test completed")
+        logger.info("Product search test completed")
     
     def test_product_information_display(self, driver, home_page):
         """
@@ -135,19 +103,20 @@ class TestProducts:
         
         Verifies that product information is displayed correctly.
         """
-        logging.info("Starting product information display test")
+        logger.info("Starting product information display test")
         
-        # Get products on page
-        products = home_page.get_products_on_page()
+        # Wait for the product list rendered after page load, then read it
+        assert home_page.wait_for_products_to_load(), "Products should load"
+        products = home_page.get_products_on_page_fast()
         assert len(products) > 0, "Should have products on page"
         
         # Verify product information
         for product in products:
             assert product['title'], "Product should have title"
             assert product['price'], "Product should have price"
-            logging.info(f"Product info verified: {product['title']} - {product['price']}")
+            logger.debug("Product info verified: %s - %s", product['title'], product['price'])
         
-        logging.info("Product information display test completed")
+        logger.info("Product information display test completed")
     
     def test_cart_navigation(self, driver, home_page):
         """
@@ -155,7 +124,7 @@ class TestProducts:
         
         Verifies navigation to cart page.
         """
-        logging.info("Starting cart navigation test")
+        logger.info("Starting cart navigation test")
         
         # Navigate to cart
         assert home_page.go_to_cart(), "Should be able to navigate to cart"
@@ -164,7 +133,7 @@ class TestProducts:
         current_url = home_page.get_current_url()
         assert "cart" in current_url.lower(), f"Should be on cart page, current URL: {current_url}"
         
-        logging.info("Cart navigation test completed")
+        logger.info("Cart navigation test completed")
     
     def test_page_navigation(self, driver, home_page):
         """
@@ -172,19 +141,19 @@ class TestProducts:
         
         Verifies page navigation functionality.
         """
-        logging.info("Starting page navigation test")
+        logger.info("Starting page navigation test")
         
         # Test next page navigation
         if home_page.is_element_clickable(home_page.NEXT_BUTTON):
             assert home_page.go_to_next_page(), "Should be able to go to next page"
-            logging.info("Next page navigation successful")
+            logger.info("Next page navigation successful")
         
         # Test previous page navigation
         if home_page.is_element_clickable(home_page.PREVIOUS_BUTTON):
             assert home_page.go_to_previous_page(), "Should be able to go to previous page"
-            logging.info("Previous page navigation successful")
+            logger.info("Previous page navigation successful")
         
-        logging.info("Page navigation test completed")
+        logger.info("Page navigation test completed")
     
     def test_home_page_refresh(self, driver, home_page):
         """
@@ -192,7 +161,7 @@ class TestProducts:
         
         Verifies that the home page can be refreshed.
         """
-        logging.info("Starting home page refresh test")
+        logger.info("Starting home page refresh test")
         
         # Refresh page
         assert home_page.refresh_page(), "Should be able to refresh page"
@@ -200,7 +169,7 @@ class TestProducts:
         # Verify page is still loaded
         assert home_page.is_home_page_loaded(), "Page should still be loaded after refresh"
         
-        logging.info("Home page refresh test completed")
+        logger.info("Home page refresh test completed")
     
     def test_product_cards_interaction(self, driver, home_page):
         """
@@ -208,18 +177,18 @@ class TestProducts:
         
         Verifies that product cards are interactive.
         """
-        logging.info("Starting product cards interaction test")
+        logger.info("Starting product cards interaction test")
         
-        # Get product cards
-        product_cards = home_page.find_elements(home_page.PRODUCT_CARDS)
-        assert len(product_cards) > 0, "Should have product cards"
+        # Count product cards without transferring the elements
+        card_count = driver.execute_script("return document.querySelectorAll(arguments[0]).length", home_page.PRODUCT_CARDS[1])
+        assert card_count > 0, "Should have product cards"
         
         # Verify product cards are clickable (they should navigate to product page)
-        first_card = product_cards[0]
+        first_card = home_page.find_element(home_page.PRODUCT_CARDS_FIRST)
         assert first_card.is_displayed(), "First product card should be visible"
         assert first_card.is_enabled(), "First product card should be enabled"
         
-        logging.info("Product cards interaction test completed")
+        logger.info("Product cards interaction test completed")
     
     def test_home_page_elements_visibility(self, driver, home_page):
         """
@@ -227,31 +196,25 @@ class TestProducts:
         
         Verifies that all main elements are visible.
         """
-        logging.info("Starting home page elements visibility test")
+        logger.info("Starting home page elements visibility test")
         
-        # Check main navigation elements
-        main_elements = [
+        # Check main navigation and category elements in a single browser call
+        elements = [
             home_page.HOME_LINK,
             home_page.CONTACT_LINK,
             home_page.ABOUT_US_LINK,
             home_page.CART_LINK,
-            home_page.LOGIN_LINK
-        ]
-        
-        for element in main_elements:
-            assert home_page.is_element_visible(element), f"Element should be visible: {element}"
-        
-        # Check category elements
-        category_elements = [
+            home_page.LOGIN_LINK,
             home_page.PHONES_CATEGORY,
             home_page.LAPTOPS_CATEGORY,
             home_page.MONITORS_CATEGORY
         ]
         
-        for element in category_elements:
-            assert home_page.is_element_visible(element), f"Category element should be visible: {element}"
+        results = home_page.batch_elements_visible(elements)
+        hidden = [element for element, visible in zip(elements, results) if not visible]
+        assert all(results), f"Elements should be visible: {hidden}"
         
-        logging.info("Home page elements visibility test completed")
+        logger.info("Home page elements visibility test completed")
     
     def test_product_loading_performance(self, driver, home_page):
         """
@@ -259,23 +222,25 @@ class TestProducts:
         
         Verifies that products load within acceptable time.
         """
-        logging.info("Starting product loading performance test")
-        
-        # Measure time to load products
-        import time
-        start_time = time.time()
+        logger.info("Starting product loading performance test")
         
         # Wait for products to load
         assert home_page.wait_for_products_to_load(timeout=15), "Products should load within 15 seconds"
         
-        end_time = time.time()
-        load_time = end_time - start_time
+        # Read DOMContentLoaded from the browser instead of timing the polling wait
+        if hasattr(driver, "execute_cdp_cmd"):
+            metrics = {m['name']: m['value'] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']}
+            load_time = metrics['DomContentLoaded'] - metrics['NavigationStart']
+        else:
+            load_time = driver.execute_script(
+                "return performance.getEntriesByType('navigation')[0].domContentLoadedEventEnd / 1000"
+            )
         
         # Verify load time is acceptable (less than 10 seconds)
-        assert load_time < 10, f"Products should load within 10 seconds, took {load_time:.2f} seconds"
+        assert load_time < 10, f"Page should reach DOMContentLoaded within 10 seconds, took {load_time:.2f} seconds"
         
-        logging.info(f"Products loaded in {load_time:.2f} seconds")
-        logging.info("Product loading performance test completed")
+        logger.info("DOMContentLoaded after %.2f seconds", load_time)
+        logger.info("Product loading performance test completed")
     
     def test_home_page_title_and_url(self, driver, home_page):
         """
@@ -283,19 +248,19 @@ class TestProducts:
         
         Verifies that the home page has correct title and URL.
         """
-        logging.info("Starting home page title and URL test")
+        logger.info("Starting home page title and URL test")
         
         # Check page title
         title = home_page.get_page_title()
         assert title, "Page should have a title"
-        logging.info(f"Page title: {title}")
+        logger.info("Page title: %s", title)
         
         # Check current URL
         current_url = home_page.get_current_url()
         assert Config.BASE_URL in current_url, f"URL should contain base URL, current: {current_url}"
-        logging.info(f"Current URL: {current_url}")
+        logger.info("Current URL: %s", current_url)
         
-        logging.info("Home page title and URL test completed")
+        logger.info("Home page title and URL test completed")
     
     def test_home_page_responsiveness(self, driver, home_page):
         """
@@ -303,24 +268,36 @@ class TestProducts:
         
         Verifies that the home page is responsive.
         """
-        logging.info("Starting home page responsiveness test")
+        logger.info("Starting home page responsiveness test")
         
         # Test different window sizes
         window_sizes = [(1920, 1080), (1366, 768), (1024, 768)]
         
-        for width, height in window_sizes:
-            logging.info(f"Testing window size: {width}x{height}")
-            
-            # Resize window
-            driver.set_window_size(width, height)
-            
-            # Verify page still loads
-            assert home_page.is_home_page_loaded(), f"Page should load at {width}x{height}"
-            
-            # Verify main elements are still visible
-            assert home_page.is_element_visible(home_page.PHONES_CATEGORY), f"Phones category should be visible at {width}x{height}"
-        
-        # Reset to default size
-        driver.maximize_window()
-        
-        logging.info("Home page responsiveness test completed")
\ No newline at end of file
+        # Emulate the viewport in the renderer when CDP is available, no OS window resize
+        use_cdp = hasattr(driver, "execute_cdp_cmd")
+        
+        try:
+            for width, height in window_sizes:
+                logger.debug("Testing window size: %dx%d", width, height)
+                
+                # Resize viewport
+                if use_cdp:
+                    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                        "width": width, "height": height, "deviceScaleFactor": 1, "mobile": False
+                    })
+                else:
+                    driver.set_window_size(width, height)
+                
+                # Verify page still loads
+                assert home_page.is_home_page_loaded(), f"Page should load at {width}x{height}"
+                
+                # Verify main elements are still visible
+                assert home_page.is_element_visible(home_page.PHONES_CATEGORY), f"Phones category should be visible at {width}x{height}"
+        finally:
+            # Reset to default size even on failure, the browser is shared with the rest of the session
+            if use_cdp:
+                driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+            else:
+                driver.set_window_size(*Config.WINDOW_SIZE)
+        
+        logger.info("Home page responsiveness test completed")
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Cached cart state for tests
+Avoids reloading cart.html when the cart has not changed
+"""
+
+import logging
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from config.config import Config
+from utils.test_data import TestData
+
+logger = logging.getLogger(__name__)
+
+CART_URL = f"{Config.BASE_URL}/cart.html"
+
+CART_ROWS_SCRIPT = f"return document.querySelectorAll('{TestData.get_selector('cart', 'cart_rows')}').length"
+
+# True once the cart page finished loading and its jQuery requests (viewcart and per-item views) are done
+CART_RENDERED_SCRIPT = """
+    return document.readyState === 'complete' && !!document.getElementById('tbodyid')
+        && !!window.jQuery && jQuery.active === 0;
+"""
+
+# Cart item counts keyed by (session_id, cart cookie value)
+_cart_counts = {}
+
+
+def _cart_key(driver):
+    """Key for the cart currently bound to the browser (demoblaze keeps it under the 'user' cookie), None without cookie"""
+    cookie = driver.get_cookie("user")
+    if not cookie:
+        return None
+    return driver.session_id, cookie.get("value")
+
+
+def wait_for_cart_rendered(driver, timeout: int = None) -> bool:
+    """
+    Wait until the cart table is in the page and no cart request is pending
+
+    Args:
+        driver (WebDriver): Browser instance
+        timeout (int): Custom wait time
+
+    Returns:
+        bool: True if the cart finished rendering in time
+    """
+    try:
+        WebDriverWait(driver, timeout or Config.EXPLICIT_WAIT, poll_frequency=Config.FAST_POLL_FREQUENCY).until(
+            lambda d: d.execute_script(CART_RENDERED_SCRIPT)
+        )
+        return True
+    except TimeoutException:
+        logger.warning("Cart did not finish rendering")
+        return False
+
+
+def get_cart_items(driver) -> int:
+    """
+    Get number of items in cart, reusing the cached count when the cart is unchanged
+
+    Navigates to the cart only when not already there and the count is not cached.
+    Rows are counted once the cart requests are done; only such counts of a cart
+    bound to a 'user' cookie are cached.
+
+    Args:
+        driver (WebDriver): Browser instance
+
+    Returns:
+        int: Number of items in cart
+    """
+    key = _cart_key(driver)
+    if key is not None and key in _cart_counts:
+        logger.debug(f"Cart count from cache: {_cart_counts[key]}")
+        return _cart_counts[key]
+
+    if not driver.current_url.split("?")[0].endswith("/cart.html"):
+        driver.get(CART_URL)
+
+    # A count read before the viewcart request returns would be a premature 0
+    rendered = wait_for_cart_rendered(driver)
+    count = driver.execute_script(CART_ROWS_SCRIPT)
+    if not rendered:
+        logger.warning(f"Cart still rendering, returning uncached count: {count}")
+        return count
+
+    if key is not None:
+        _cart_counts[key] = count
+    logger.debug(f"Cart count from page: {count}")
+    return count
+
+
+def invalidate_cart_cache(driver) -> None:
+    """
+    Drop cached cart counts for the browser session
+
+    Args:
+        driver (WebDriver): Browser instance
+    """
+    for key in [key for key in _cart_counts if key[0] == driver.session_id]:
+        del _cart_counts[key]
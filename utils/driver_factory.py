@@ -5,14 +5,69 @@ Supports Chrome and Firefox with optimized configurations
 
 import os
 import logging
+import shutil
+import tempfile
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from config.config import Config
+
+# Quieter webdriver-manager that keeps downloaded drivers next to the project
+os.environ.setdefault("WDM_LOCAL", "1")
+os.environ.setdefault("WDM_LOG_LEVEL", "0")
+
+# Static Chrome flags, applied to every Chrome session
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-logging",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--ignore-certificate-errors",
+    "--ignore-ssl-errors",
+    "--ignore-certificate-errors-spki-list",
+    # Performance options
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-background-networking",
+    "--blink-settings=imagesEnabled=false",
+)
+
+# Images, fonts and trackers are blocked via CDP in DriverFactory._configure_driver
+_CHROME_PREFS = {
+    "profile.default_content_settings.popups": 0
+}
+
+_FIREFOX_PREFS = {
+    "dom.webnotifications.enabled": False,
+    "media.volume_scale": "0.0",
+    "dom.push.enabled": False,
+    "dom.push.connection.enabled": False,
+    "dom.push.serverURL": "",
+    "dom.push.userAgentID": "",
+    "dom.push.registrationURL": "",
+    # Disable images for faster loading
+    "permissions.default.image": 2,
+}
+
+# Driver binary paths resolved by webdriver-manager, keyed by browser name
+_DRIVER_PATH_CACHE: dict = {}
+
+
+def _get_driver_path(browser: str, manager_class) -> str:
+    """Resolve a driver binary once per process"""
+    if browser not in _DRIVER_PATH_CACHE:
+        _DRIVER_PATH_CACHE[browser] = manager_class().install()
+    return _DRIVER_PATH_CACHE[browser]
 
 
 class DriverFactory:
@@ -21,6 +76,7 @@ class DriverFactory:
     def __init__(self):
         self.driver = None
         self.logger = logging.getLogger(__name__)
+        self._profile_dir = None
     
     def create_driver(self, browser="chrome", headless=False, window_size=(1920, 1080)):
         """
@@ -35,6 +91,10 @@ class DriverFactory:
             WebDriver: Configured browser instance
         """
         try:
+            # HTTP timeout for WebDriver commands. It is a process-wide RemoteConnection setting
+            # read when the connection pool is built, so it must be set before creating the driver
+            RemoteConnection.set_timeout(Config.CMD_TIMEOUT)
+            
             if browser.lower() == "chrome":
                 self.driver = self._create_chrome_driver(headless, window_size)
             elif browser.lower() == "firefox":
@@ -49,42 +109,40 @@ class DriverFactory:
             
         except Exception as e:
             self.logger.error(f"Error creating driver: {e}")
+            self._remove_profile_dir()
             raise
     
     def _create_chrome_driver(self, headless, window_size):
         """Create Chrome driver with optimized settings"""
         chrome_options = ChromeOptions()
         
+        # Return from navigation at DOMContentLoaded, explicit waits cover the rest
+        chrome_options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+        
         # Basic options
         if headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         
         chrome_options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--ignore-ssl-errors")
-        chrome_options.add_argument("--ignore-certificate-errors-spki-list")
+        for argument in _CHROME_ARGS:
+            chrome_options.add_argument(argument)
         
-        # Performance options
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-features=TranslateUI")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        
-        # Disable images for faster loading (optional)
-        prefs = {
-            "profile.managed_default_content_settings.images": 2,
-            "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 2
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        # Isolated throwaway profile per driver so parallel workers don't share user data,
+        # removed again in quit_driver (a local path means nothing to a Grid node)
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        if not Config.SELENIUM_HUB_URL:
+            self._profile_dir = tempfile.mkdtemp(prefix=f"chrome-{worker_id}-")
+            chrome_options.add_argument(f"--user-data-dir={self._profile_dir}")
+        
+        # Keep static assets in a disk cache reused across navigations
+        chrome_options.add_argument(f"--disk-cache-dir={tempfile.gettempdir()}/selenium-cache-{worker_id}")
+        chrome_options.add_argument(f"--disk-cache-size={Config.DISK_CACHE_SIZE}")
+        
+        chrome_options.add_experimental_option("prefs", _CHROME_PREFS)
+        
+        # Use the Selenium Grid when configured
+        if Config.SELENIUM_HUB_URL:
+            return self._create_remote_driver(chrome_options)
         
         # Create service and driver
         try:
@@ -92,8 +150,9 @@ class DriverFactory:
             service = ChromeService()
             driver = webdriver.Chrome(service=service, options=chrome_options)
         except Exception:
-            # If that fails, use webdriver-manager
-            service = ChromeService(ChromeDriverManager().install())
+            # If that fails, use webdriver-manager (imported only on this fallback path)
+            from webdriver_manager.chrome import ChromeDriverManager
+            service = ChromeService(_get_driver_path("chrome", ChromeDriverManager))
             driver = webdriver.Chrome(service=service, options=chrome_options)
         
         return driver
@@ -102,6 +161,9 @@ class DriverFactory:
         """Create Firefox driver with optimized settings"""
         firefox_options = FirefoxOptions()
         
+        # Return from navigation at DOMContentLoaded, explicit waits cover the rest
+        firefox_options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+        
         # Basic options
         if headless:
             firefox_options.add_argument("--headless")
@@ -110,39 +172,59 @@ class DriverFactory:
         firefox_options.add_argument(f"--height={window_size[1]}")
         
         # Performance options
-        firefox_options.set_preference("dom.webnotifications.enabled", False)
-        firefox_options.set_preference("media.volume_scale", "0.0")
-        firefox_options.set_preference("dom.push.enabled", False)
-        firefox_options.set_preference("dom.push.connection.enabled", False)
-        firefox_options.set_preference("dom.push.serverURL", "")
-        firefox_options.set_preference("dom.push.userAgentID", "")
-        firefox_options.set_preference("dom.push.registrationURL", "")
+        for name, value in _FIREFOX_PREFS.items():
+            firefox_options.set_preference(name, value)
         
-        # Disable images for faster loading (optional)
-        firefox_options.set_preference("permissions.default.image", 2)
+        # Use the Selenium Grid when configured
+        if Config.SELENIUM_HUB_URL:
+            return self._create_remote_driver(firefox_options)
         
         # Create service and driver
         try:
             service = FirefoxService()
             driver = webdriver.Firefox(service=service, options=firefox_options)
         except Exception:
-            service = FirefoxService(GeckoDriverManager().install())
+            from webdriver_manager.firefox import GeckoDriverManager
+            service = FirefoxService(_get_driver_path("firefox", GeckoDriverManager))
             driver = webdriver.Firefox(service=service, options=firefox_options)
         
         return driver
     
+    def _create_remote_driver(self, options):
+        """Create Remote driver on the Selenium Grid hub"""
+        driver = webdriver.Remote(command_executor=Config.SELENIUM_HUB_URL, options=options)
+        self.logger.info(f"Remote driver created on {Config.SELENIUM_HUB_URL}")
+        return driver
+    
     def _configure_driver(self):
         """Apply common driver configurations"""
         if self.driver:
             # Set timeouts
-            self.driver.implicitly_wait(10)
-            self.driver.set_page_load_timeout(30)
-            self.driver.set_script_timeout(30)
+            self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
+            self.driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+            self.driver.set_script_timeout(Config.SCRIPT_TIMEOUT)
+            
+            # Refuse images, fonts and trackers at the network layer and collect page metrics
+            self._configure_cdp()
             
             # Maximize window if not headless
             if not self.driver.capabilities.get('headless', False):
                 self.driver.maximize_window()
     
+    def _configure_cdp(self):
+        """Block URLs in Config.BLOCKED_URL_PATTERNS and enable Performance metrics via CDP (local Chrome only, Remote and Firefox have no CDP)"""
+        browser_name = self.driver.capabilities.get('browserName', '').lower()
+        if 'chrome' not in browser_name or not hasattr(self.driver, "execute_cdp_cmd"):
+            return
+        
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": Config.BLOCKED_URL_PATTERNS})
+            self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+        except Exception as e:
+            self.logger.warning(f"Could not configure CDP: {e}")
+    
     def quit_driver(self):
         """Quit the current driver instance"""
         if self.driver:
@@ -153,6 +235,14 @@ class DriverFactory:
                 self.logger.error(f"Error closing driver: {e}")
             finally:
                 self.driver = None
+        self._remove_profile_dir()
+    
+    def _remove_profile_dir(self):
+        """Delete the temporary Chrome profile created for the current driver"""
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self.logger.debug(f"Removed Chrome profile: {self._profile_dir}")
+            self._profile_dir = None
 
 
 # Global instance
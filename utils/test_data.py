@@ -2,10 +2,20 @@
 Datos de prueba centralizados para el framework de automatización
 """
 
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Mapping, Tuple, Any
 from config.config import Config
 
 
+def _freeze(value: Any) -> Any:
+    """Convierte dicts y listas anidados en MappingProxyType y tuplas de solo lectura"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class TestData:
     """Clase para manejar datos de prueba centralizados"""
     
@@ -23,7 +33,7 @@ class TestData:
     
     # Productos de prueba
     PRODUCTS = {
-        "phones": [
+        "phones": (
             "Samsung galaxy s6",
             "Nokia lumia 1520",
             "Nexus 6",
@@ -31,21 +41,24 @@ class TestData:
             "Iphone 6 32gb",
             "Sony xperia z5",
             "HTC One M9"
-        ],
-        "laptops": [
+        ),
+        "laptops": (
             "Sony vaio i5",
             "Sony vaio i7",
             "MacBook air",
             "Dell i7 8gb",
             "2017 Dell 15.6 Inch",
             "MacBook Pro"
-        ],
-        "monitors": [
+        ),
+        "monitors": (
             "Apple monitor 24",
             "ASUS Full HD"
-        ]
+        )
     }
     
+    # Todos los productos, calculado una sola vez al definir la clase
+    ALL_PRODUCTS = tuple(product for category in PRODUCTS.values() for product in category)
+    
     # Datos de checkout
     CHECKOUT_DATA = {
         "valid": {
@@ -91,31 +104,42 @@ class TestData:
             "close_button": "//button[text()='Close']"
         },
         "navigation": {
-            "home_link": "//a[text()='Home ']",
-            "cart_link": "//a[text()='Cart']",
-            "logout_link": "//a[text()='Log out']"
+            "home_link": "#navbarExample a.nav-link[href='index.html']",
+            "cart_link": "#cartur",
+            "logout_link": "#logout2"
+        },
+        "cart": {
+            "cart_rows": "#tbodyid > tr"
         },
         "products": {
             "product_card": "//div[@class='card h-100']",
             "product_title": ".card-title",
             "product_price": ".card-text",
-            "add_to_cart": "//a[text()='Add to cart']"
+            "add_to_cart": "a.btn-success[onclick^='addToCart']"
         }
     }
     
+    # Datos compartidos de solo lectura
+    USERS = _freeze(USERS)
+    PRODUCTS = _freeze(PRODUCTS)
+    CHECKOUT_DATA = _freeze(CHECKOUT_DATA)
+    MESSAGES = _freeze(MESSAGES)
+    URLS = _freeze(URLS)
+    SELECTORS = _freeze(SELECTORS)
+    
     @classmethod
-    def get_user(cls, user_type: str = "valid_user") -> Dict[str, str]:
+    def get_user(cls, user_type: str = "valid_user") -> Mapping[str, str]:
         """Retorna datos de usuario específicos"""
         return cls.USERS.get(user_type, cls.USERS["valid_user"])
     
     @classmethod
-    def get_products(cls, category: str = "phones", count: int = 2) -> List[str]:
+    def get_products(cls, category: str = "phones", count: int = 2) -> Tuple[str, ...]:
         """Retorna lista de productos de una categoría específica"""
         products = cls.PRODUCTS.get(category, cls.PRODUCTS["phones"])
         return products[:count]
     
     @classmethod
-    def get_checkout_data(cls, data_type: str = "valid") -> Dict[str, str]:
+    def get_checkout_data(cls, data_type: str = "valid") -> Mapping[str, str]:
         """Retorna datos de checkout específicos"""
         return cls.CHECKOUT_DATA.get(data_type, cls.CHECKOUT_DATA["valid"])
     
@@ -135,9 +159,6 @@ class TestData:
         return cls.SELECTORS.get(section, {}).get(element, "")
     
     @classmethod
-    def get_all_products(cls) -> List[str]:
+    def get_all_products(cls) -> Tuple[str, ...]:
         """Retorna todos los productos disponibles"""
-        all_products = []
-        for category_products in cls.PRODUCTS.values():
-            all_products.extend(category_products)
-        return all_products
+        return cls.ALL_PRODUCTS